@@ -128,8 +128,8 @@ class AdamES(BaseAgent):
     def _fit(
         self, batch_size: int, actor_epochs: int = 1, critic_epochs: int = 1
     ) -> Log:
-        divergences = np.zeros(actor_epochs)
-        entropies = np.zeros(actor_epochs)
+        divergence = 0.0
+        entropy = 0.0
 
         trajectories = self.buffer.all(dtype="numpy")
         rewards = trajectories.rewards.squeeze()
@@ -141,14 +141,14 @@ class AdamES(BaseAgent):
             np.mean(self.updater.std) * self.env.num_envs
         )
         optimization_direction = self._adam(grad_approx)
-        for i in range(actor_epochs):
+        for _ in range(actor_epochs):
             log = self.updater(
                 learning_rate=self.learning_rate,
                 optimization_direction=optimization_direction,
                 mutation_operator=self.mutation_operator,
             )
-            divergences[i] = log.divergence
-            entropies[i] = log.entropy
+            divergence += float(log.divergence)
+            entropy += float(log.entropy)
         self.buffer.reset()
 
-        return Log(divergence=divergences.sum(), entropy=entropies.mean())
+        return Log(divergence=divergence, entropy=entropy / actor_epochs)
@@ -3,8 +3,8 @@ from typing import Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import torch as T
-from gym import Env
-from gym.vector import VectorEnv
+from gym import Env, spaces
+from gym.vector import SyncVectorEnv, VectorEnv
 
 from pearll import settings
 from pearll.buffers.base_buffer import BaseBuffer
@@ -12,9 +12,9 @@ from pearll.callbacks.base_callback import BaseCallback
 from pearll.common.enumerations import FrequencyType
 from pearll.common.logging_ import Logger
 from pearll.common.type_aliases import Log, Observation, Tensor, Trajectories
-from pearll.common.utils import get_device, set_seed
+from pearll.common.utils import broadcast_module_state, get_device, set_seed, to_torch
 from pearll.explorers.base_explorer import BaseExplorer
-from pearll.models.actor_critics import ActorCritic
+from pearll.models.actor_critics import ActorCritic, Dummy
 from pearll.settings import (
     BufferSettings,
     ExplorerSettings,
@@ -34,6 +34,11 @@ class BaseAgent(ABC):
     See the example agents already done for guidance and settings.py for settings objects
     that can be used.
 
+    For multi-GPU critic updates, launch one process per GPU (e.g. with `torchrun`) and call
+    `torch.distributed.init_process_group("nccl")` before constructing the agent. The model
+    weights are then broadcast from rank 0 and the critic gradients are averaged across
+    processes on each update.
+
     :param env: the gym-like environment to be used
     :param model: the neural network model
     :param buffer_class: the buffer class for storing and sampling trajectories
@@ -75,12 +80,30 @@ class BaseAgent(ABC):
         self.env = env
         self.model = model
         self.render = misc_settings.render
+        self.jit_critic = misc_settings.jit_critic
+        self._maybe_jit_critic()
+        self.compile_critic = misc_settings.compile_critic
+        self.compile_actor = misc_settings.compile_actor
+        self._maybe_compile()
+        broadcast_module_state(self.model, *self.model.actors, *self.model.critics)
         explorer_settings = explorer_settings.filter_none()
         self.action_explorer = action_explorer_class(
             action_space=env.action_space, **explorer_settings
         )
         buffer_settings = buffer_settings.filter_none()
         self.buffer = buffer_class(env=env, **buffer_settings)
+        # Stage observations through pinned memory so the copy to the GPU is asynchronous
+        self._observation_buffer = None
+        self._observation_copied = None
+        if settings.DEVICE.type == "cuda" and isinstance(
+            env.observation_space, spaces.Box
+        ):
+            self._observation_buffer = T.empty(
+                env.observation_space.shape,
+                dtype=T.as_tensor(np.zeros(0, dtype=env.observation_space.dtype)).dtype,
+                pin_memory=True,
+            )
+            self._observation_copied = T.cuda.Event()
         self.step = 0
         self.episode = 0
         self.done = False  # Flag terminate training
@@ -104,6 +127,48 @@ class BaseAgent(ABC):
             self.logger.info(f"Using seed {misc_settings.seed}")
             set_seed(misc_settings.seed, self.env)
 
+    def _maybe_jit_critic(self) -> None:
+        """
+        Script the critic torsos with TorchScript if `jit_critic` is set.
+        Only the torsos are scripted since the encoders accept numpy inputs, and
+        torsos shared with the actor are left as they are to keep the weights shared.
+        """
+        if not self.jit_critic:
+            return
+        actor_torsos = [actor.model.torso for actor in self.model.actors]
+        for critic in [self.model.critic] + self.model.critics:
+            torso = critic.model.torso
+            if (
+                isinstance(critic, Dummy)
+                or isinstance(torso, T.jit.ScriptModule)
+                or any(torso is actor_torso for actor_torso in actor_torsos)
+            ):
+                continue
+            critic.model.torso = T.jit.script(torso)
+
+    def _maybe_compile(self) -> None:
+        """
+        Compile the critic and actor networks with `torch.compile` if `compile_critic` and
+        `compile_actor` are set respectively.
+        The networks are compiled in place so their parameters and state dict keys are
+        unchanged and the updaters can keep using them directly.
+        """
+        if not (self.compile_critic or self.compile_actor):
+            return
+        if not hasattr(T.nn.Module, "compile"):
+            self.logger.warning(
+                f"torch.compile isn't supported by PyTorch {T.__version__}, skipping"
+            )
+            return
+        networks = []
+        if self.compile_critic:
+            networks += [self.model.critic] + self.model.critics
+        if self.compile_actor:
+            networks += [self.model.actor] + self.model.actors
+        for network in networks:
+            if not isinstance(network, Dummy):
+                network.model.compile()
+
     @T.no_grad()
     def predict(self, observations: Union[Tensor, Dict[str, Tensor]]) -> T.Tensor:
         """Run the agent actor model"""
@@ -147,7 +212,16 @@ class BaseAgent(ABC):
         for _ in range(num_steps):
             if self.render:
                 self.env.render()
-            action = self.action_explorer(self.model, observation, self.step)
+            if self._observation_buffer is not None:
+                # The previous copy out of the staging buffer must finish before it's overwritten
+                self._observation_copied.synchronize()
+                model_observation = to_torch(observation, out=self._observation_buffer)
+                self._observation_copied.record()
+            else:
+                model_observation = observation
+            # Rollouts never backpropagate so skip building the autograd graph
+            with T.no_grad():
+                action = self.action_explorer(self.model, model_observation, self.step)
             next_observation, reward, done, _ = self.env.step(action)
             self.buffer.add_trajectory(
                 observation, action, reward, next_observation, done
@@ -161,7 +235,7 @@ class BaseAgent(ABC):
 
             # If all environment episodes are done, reset and check if we should dump the log
             if self.logger.check_episode_done(done):
-                observation = self.env.reset()
+                observation = self._reset_env(observation, done)
                 if self.log_frequency[0] == FrequencyType.EPISODE:
                     if self.episode % self.log_frequency[1] == 0:
                         self.dump_log()
@@ -179,6 +253,27 @@ class BaseAgent(ABC):
             self.step += 1
         return observation
 
+    def _reset_env(self, observation: Observation, done: np.ndarray) -> Observation:
+        """
+        Reset the environment once every episode has completed.
+        Sync vector environments already auto-reset the sub-environments that are done, so
+        only the sub-environments still running are reset here. Otherwise, including for
+        wrapped vector environments whose wrappers the sub-environment resets would bypass,
+        fall back to resetting the whole environment.
+
+        :param observation: the latest observation from the environment
+        :param done: the done flags from the latest step
+        :return: the observation to continue from
+        """
+        if type(self.env) is not SyncVectorEnv or not isinstance(
+            observation, np.ndarray
+        ):
+            return self.env.reset()
+        observation = observation.copy()
+        for i in np.flatnonzero(~np.asarray(done, dtype=bool)):
+            observation[i] = self.env.envs[i].reset()
+        return observation
+
     @abstractmethod
     def _fit(
         self, batch_size: int, actor_epochs: int = 1, critic_epochs: int = 1
@@ -72,7 +72,7 @@ def get_default_model(env: Env) -> ActorCritic:
     )
 
 
-@dataclass
+@dataclass(frozen=True)
 class NaiveSelectionSettings(Settings):
     ratio: float = 0.5
 
@@ -156,8 +156,8 @@ class CEM_RL(BaseAgent):
 
     def _fit(self, batch_size: int, actor_epochs: int = 1, critic_epochs: int = 1):
         critic_losses = np.zeros(critic_epochs)
-        divergences = np.zeros(actor_epochs)
-        entropies = np.zeros(actor_epochs)
+        divergence = 0.0
+        entropy = 0.0
 
         model_copy = copy.deepcopy(self.model)
 
@@ -195,10 +195,10 @@ class CEM_RL(BaseAgent):
         self.model.set_actors_state(new_state)
 
         # Evaluate new model
-        episode_dones = [False for _ in range(self.eval_env.num_envs)]
+        episode_dones = np.zeros(self.eval_env.num_envs, dtype=bool)
         observation = self.eval_env.reset()
         episode_length = 0
-        while not np.all(episode_dones):
+        while not episode_dones.all():
             action = to_numpy(self.model(observation))
             next_observation, reward, done, _ = self.eval_env.step(action)
             self.buffer.add_trajectory(
@@ -206,30 +206,33 @@ class CEM_RL(BaseAgent):
             )
             episode_length += 1
             observation = next_observation
-            episode_dones = np.logical_or(episode_dones, done)
+            np.logical_or(episode_dones, done, out=episode_dones)
 
-        trajectories = self.buffer.last(episode_length, flatten_env=False)
+        # The evolutionary operators work in numpy so sample the rewards as numpy arrays
+        trajectories = self.buffer.last(
+            episode_length, flatten_env=False, dtype="numpy"
+        )
         rewards = trajectories.rewards.squeeze()
         rewards = filter_rewards(rewards, trajectories.dones.squeeze())
         if rewards.ndim > 1:
             rewards = rewards.sum(axis=-1)
 
         # Train actor for actor_epochs
-        for i in range(actor_epochs):
+        for _ in range(actor_epochs):
             actor_log = self.actor_updater(
                 rewards=rewards,
                 selection_operator=self.selection_operator,
                 crossover_operator=self.crossover_operator,
                 elitism=0,
             )
-            divergences[i] = actor_log.divergence
-            entropies[i] = actor_log.entropy
+            divergence += float(actor_log.divergence)
+            entropy += float(actor_log.entropy)
 
         # Update target networks
         self.model.update_targets()
 
         return Log(
             critic_loss=np.mean(critic_losses),
-            divergence=np.mean(divergences),
-            entropy=np.mean(entropies),
+            divergence=divergence / actor_epochs,
+            entropy=entropy / actor_epochs,
         )
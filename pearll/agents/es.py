@@ -106,8 +106,8 @@ class ES(BaseAgent):
     def _fit(
         self, batch_size: int, actor_epochs: int = 1, critic_epochs: int = 1
     ) -> Log:
-        divergences = np.zeros(actor_epochs)
-        entropies = np.zeros(actor_epochs)
+        divergence = 0.0
+        entropy = 0.0
 
         trajectories = self.buffer.all(dtype="numpy")
         rewards = trajectories.rewards.squeeze()
@@ -118,14 +118,14 @@ class ES(BaseAgent):
         optimization_direction = np.dot(self.updater.normal_dist.T, scaled_rewards) / (
             np.mean(self.updater.std) * self.env.num_envs
         )
-        for i in range(actor_epochs):
+        for _ in range(actor_epochs):
             log = self.updater(
                 learning_rate=self.learning_rate,
                 optimization_direction=optimization_direction,
                 mutation_operator=self.mutation_operator,
             )
-            divergences[i] = log.divergence
-            entropies[i] = log.entropy
+            divergence += float(log.divergence)
+            entropy += float(log.entropy)
         self.buffer.reset()
 
-        return Log(divergence=divergences.sum(), entropy=entropies.mean())
+        return Log(divergence=divergence, entropy=entropy / actor_epochs)
@@ -1,3 +1,4 @@
+import inspect
 from functools import partial
 from typing import Callable, List, Optional, Type
 
@@ -45,14 +46,35 @@ def default_model(env: VectorEnv):
     )
 
 
+def _bind_operator(
+    operator: Callable, rng: np.random.Generator, settings: Settings
+) -> Callable:
+    """
+    Bind the operator settings and, if the operator accepts it, the random number generator.
+
+    :param operator: the evolutionary operator
+    :param rng: the random number generator to draw from
+    :param settings: the operator settings
+    :return: the bound operator
+    """
+    kwargs = settings.filter_none()
+    if "rng" in inspect.signature(operator).parameters:
+        kwargs.setdefault("rng", rng)
+    return partial(operator, **kwargs)
+
+
 class GA(BaseAgent):
     """
     Genetic Algorithm
     https://www.geeksforgeeks.org/genetic-algorithms/
 
+    Each individual in the population is evaluated in its own sub-environment of the VectorEnv.
+    To evaluate the population in parallel worker processes, pass an asynchronous vector
+    environment, e.g. `gym.vector.make(env_id, num_envs=population_size, asynchronous=True)`.
+
     :param env: the gym-like environment to be used, should be a VectorEnv
     :param model: the neural network model
-    :param updater_class: the updater class to be used
+    :param updater_class: the updater class to be used, e.g. `PBTUpdater` for population based training
     :param selection_operator: the selection operator to be used
     :param selection_settings: the selection settings to be used
     :param crossover_operator: the crossover operator to be used
@@ -108,38 +130,63 @@ class GA(BaseAgent):
 
         self.updater = updater_class(self.model)
 
-        self.selection_operator = partial(
-            selection_operator, **selection_settings.filter_none()
+        # A dedicated generator is faster than the global numpy random state for bulk sampling
+        bit_generator = (
+            np.random.PCG64DXSM(misc_settings.seed)
+            if hasattr(np.random, "PCG64DXSM")
+            else np.random.PCG64(misc_settings.seed)
         )
-        self.crossover_operator = partial(
-            crossover_operator, **crossover_settings.filter_none()
+        self.rng = np.random.default_rng(bit_generator)
+        self.selection_operator = _bind_operator(
+            selection_operator, self.rng, selection_settings
         )
-        self.mutation_operator = partial(
-            mutation_operator, **mutation_settings.filter_none()
+        self.crossover_operator = _bind_operator(
+            crossover_operator, self.rng, crossover_settings
         )
+        self.mutation_operator = _bind_operator(
+            mutation_operator, self.rng, mutation_settings
+        )
+        updater_parameters = inspect.signature(self.updater).parameters
+        # Updaters which draw random numbers themselves, e.g. `PBTUpdater`, share the generator
+        self._updater_kwargs = {"rng": self.rng} if "rng" in updater_parameters else {}
+        # Custom updaters which run a single epoch per call are called once per epoch instead
+        self._updater_runs_epochs = "num_epochs" in updater_parameters
         self.elitism = elitism
 
     def _fit(
         self, batch_size: int, actor_epochs: int = 1, critic_epochs: int = 1
     ) -> Log:
-        divergences = np.zeros(actor_epochs)
-        entropies = np.zeros(actor_epochs)
-
         trajectories = self.buffer.sample(batch_size, dtype="numpy")
         rewards = trajectories.rewards.squeeze()
         rewards = filter_rewards(rewards, trajectories.dones.squeeze())
         if rewards.ndim > 1:
-            rewards = rewards.sum(dim=-1)
-        for i in range(actor_epochs):
+            rewards = rewards.sum(axis=-1)
+        if self._updater_runs_epochs:
             log = self.updater(
                 rewards=rewards,
                 selection_operator=self.selection_operator,
                 crossover_operator=self.crossover_operator,
                 mutation_operator=self.mutation_operator,
                 elitism=self.elitism,
+                num_epochs=actor_epochs,
+                **self._updater_kwargs,
             )
-            divergences[i] = log.divergence
-            entropies[i] = log.entropy
+            divergence, entropy = log.divergence, log.entropy
+        else:
+            divergences = np.zeros(actor_epochs)
+            entropies = np.zeros(actor_epochs)
+            for i in range(actor_epochs):
+                log = self.updater(
+                    rewards=rewards,
+                    selection_operator=self.selection_operator,
+                    crossover_operator=self.crossover_operator,
+                    mutation_operator=self.mutation_operator,
+                    elitism=self.elitism,
+                    **self._updater_kwargs,
+                )
+                divergences[i] = log.divergence
+                entropies[i] = log.entropy
+            divergence, entropy = divergences.sum(), entropies.mean()
         self.buffer.reset()
 
-        return Log(divergence=divergences.sum(), entropy=entropies.mean())
+        return Log(divergence=divergence, entropy=entropy)
@@ -28,7 +28,7 @@ class YourRLAgent(BaseAgent):
 
     For example:
     ```
-    @dataclass
+    @dataclass(frozen=True)
     class HERBufferSettings(BufferSettings):
         goal_selection_strategy: Union[str, GoalSelectionStrategy] = "future"
         n_sampled_goal: int = 4
@@ -1,6 +1,6 @@
 import warnings
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 import psutil
@@ -20,13 +20,24 @@ class BaseBuffer(ABC):
 
     :param env: the environment
     :param buffer_size: max number of elements in the buffer
+    :param compression: optional compression for the stored observations, only buffers which
+        set `supports_compression` accept it
     """
 
+    # Whether the buffer can compress its stored observations
+    supports_compression = False
+
     def __init__(
         self,
         env: Env,
         buffer_size: int,
+        compression: Optional[str] = None,
     ) -> None:
+        if compression is not None and not self.supports_compression:
+            raise ValueError(
+                f"{type(self).__name__} doesn't support observation compression, "
+                f"got compression={compression}"
+            )
         self.env = env
         self.buffer_size = buffer_size
         self.full = False
@@ -55,6 +66,19 @@ class BaseBuffer(ABC):
         self.rewards = np.zeros(self.batch_shape + (1,), dtype=np.float32)
         self.dones = np.zeros(self.batch_shape + (1,), dtype=np.float32)
 
+    def _clear(self, *buffers: np.ndarray) -> None:
+        """
+        Clear the rows written since the last reset in place, so the buffer memory is reused
+        rather than reallocated and untouched rows are never paged in.
+        Must be called before `pos` and `full` are reset.
+        """
+        # Replay style buffers also write the next observation one row ahead of `pos`
+        num_written = (
+            self.buffer_size if self.full else min(self.pos + 1, self.buffer_size)
+        )
+        for buffer in buffers:
+            buffer[:num_written] = None if buffer.dtype == object else 0
+
     @staticmethod
     def _check_system_memory(*buffers) -> None:
         """Check that the replay buffer can fit into memory"""
@@ -88,6 +112,39 @@ class BaseBuffer(ABC):
 
         return data
 
+    @staticmethod
+    def _to_device(data: np.ndarray) -> T.Tensor:
+        """
+        Move a sampled field to the device. On the GPU the gathered samples are staged in
+        pinned memory so the copy runs asynchronously with the host.
+
+        :param data: the sampled field
+        :return: the field as a tensor on the device
+        """
+        tensor = T.from_numpy(data)
+        if settings.DEVICE.type == "cuda":
+            tensor = tensor.pin_memory()
+        return tensor.to(settings.DEVICE, non_blocking=True)
+
+    def _batch_positions(self, batch_size: int) -> np.ndarray:
+        """
+        Get the buffer positions to write a batch of trajectories to, wrapping around the end
+        of the buffer, and advance the buffer position past them. If the batch is larger than
+        the buffer, only the positions of the latest trajectories which fit are returned.
+
+        :param batch_size: the number of trajectories in the batch
+        :return: the buffer positions
+        """
+        num_written = min(batch_size, self.buffer_size)
+        positions = (
+            self.pos + np.arange(batch_size - num_written, batch_size)
+        ) % self.buffer_size
+        self.pos += batch_size
+        if self.pos >= self.buffer_size:
+            self.full = True
+            self.pos %= self.buffer_size
+        return positions
+
     def _transform_samples(
         self,
         flatten_env: bool,
@@ -130,15 +187,11 @@ class BaseBuffer(ABC):
 
         # return torch tensors instead of numpy arrays
         if dtype == TrajectoryType.TORCH:
-            observations = T.from_numpy(observations).to(
-                settings.DEVICE, non_blocking=True
-            )
-            actions = T.from_numpy(actions).to(settings.DEVICE, non_blocking=True)
-            rewards = T.from_numpy(rewards).to(settings.DEVICE, non_blocking=True)
-            next_observations = T.from_numpy(next_observations).to(
-                settings.DEVICE, non_blocking=True
-            )
-            dones = T.from_numpy(dones).to(settings.DEVICE, non_blocking=True)
+            observations = self._to_device(observations)
+            actions = self._to_device(actions)
+            rewards = self._to_device(rewards)
+            next_observations = self._to_device(next_observations)
+            dones = self._to_device(dones)
 
         return Trajectories(
             observations=observations,
@@ -152,20 +205,10 @@ class BaseBuffer(ABC):
     def reset(self) -> None:
         """Reset the buffer"""
 
+        self._clear(self.observations, self.actions, self.rewards, self.dones)
         self.pos = 0
         self.full = False
 
-        self.observations = np.zeros(
-            (self.buffer_size,) + self.obs_shape,
-            dtype=self.env.observation_space.dtype,
-        )
-        self.actions = np.zeros(
-            (self.buffer_size,) + self.action_shape,
-            dtype=self.env.action_space.dtype,
-        )
-        self.rewards = np.zeros(self.batch_shape + (1,), dtype=np.float32)
-        self.dones = np.zeros(self.batch_shape + (1,), dtype=np.float32)
-
     @abstractmethod
     def add_trajectory(
         self,
@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 import torch as T
@@ -26,6 +26,7 @@ class HERBuffer(BaseBuffer):
     :param buffer_size: max number of elements in the buffer
     :param goal_selection_strategy: the goal selection strategy to be used, defaults to future
     :param n_sampled_goal: ratio of HER data to data coming from normal experience replay
+    :param compression: observation compression isn't supported, must be None
     """
 
     def __init__(
@@ -34,8 +35,9 @@ class HERBuffer(BaseBuffer):
         buffer_size: int,
         goal_selection_strategy: Union[str, GoalSelectionStrategy] = "future",
         n_sampled_goal: int = 4,
+        compression: Optional[str] = None,
     ) -> None:
-        super().__init__(env, buffer_size)
+        super().__init__(env, buffer_size, compression)
         self.env = env
         self.desired_goals = np.zeros(
             (self.buffer_size,) + self.obs_shape,
@@ -72,23 +74,15 @@ class HERBuffer(BaseBuffer):
         self.her_ratio = 1 - (1.0 / (n_sampled_goal + 1))
 
     def reset(self) -> None:
+        self._clear(
+            self.desired_goals,
+            self.next_achieved_goals,
+            self.episode_end_indices,
+            self.index_episode_map,
+        )
         super().reset()
         self.episode = 0
 
-        self.desired_goals = np.zeros(
-            (self.buffer_size,) + self.obs_shape,
-            dtype=self.env.observation_space.dtype,
-        )
-        self.next_achieved_goals = np.zeros(
-            (self.buffer_size,) + self.obs_shape,
-            dtype=self.env.observation_space.dtype,
-        )
-
-        # Keep track of where in the data structure episodes end
-        self.episode_end_indices = np.zeros(self.batch_shape, dtype=np.int8)
-        # Keep track of which transitions belong to which episodes.
-        self.index_episode_map = np.zeros(self.batch_shape, dtype=np.int8)
-
     def add_trajectory(
         self,
         observation: Dict[str, np.ndarray],
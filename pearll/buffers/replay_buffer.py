@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 from gym import Env
@@ -19,16 +19,19 @@ class ReplayBuffer(BaseBuffer):
 
     :param env: the environment
     :param buffer_size: max number of elements in the buffer
+    :param compression: observation compression isn't supported, must be None
     """
 
     def __init__(
         self,
         env: Env,
         buffer_size: int,
+        compression: Optional[str] = None,
     ) -> None:
         super().__init__(
             env,
             buffer_size,
+            compression,
         )
         self._check_system_memory(
             self.observations, self.actions, self.rewards, self.dones
@@ -56,6 +59,33 @@ class ReplayBuffer(BaseBuffer):
             self.full = True
             self.pos = 0
 
+    def add_batch_trajectories(
+        self,
+        observations: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_observations: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        positions = self._batch_positions(len(observations))
+        batch_size = len(positions)
+        # Only the latest trajectories fit if the batch is larger than the buffer
+        observations, actions, rewards, next_observations, dones = (
+            np.asarray(data)[-batch_size:]
+            for data in (observations, actions, rewards, next_observations, dones)
+        )
+        self.observations[positions] = observations
+        # Each next observation is the following observation apart from the last one
+        last_position = (positions[-1] + 1) % self.buffer_size
+        self.observations[last_position] = next_observations[-1]
+        self.actions[positions] = np.reshape(
+            actions, (batch_size,) + self.actions.shape[1:]
+        )
+        self.rewards[positions] = np.reshape(
+            rewards, (batch_size,) + self.rewards.shape[1:]
+        )
+        self.dones[positions] = np.reshape(dones, (batch_size,) + self.dones.shape[1:])
+
     def sample(
         self,
         batch_size: int,
@@ -1,4 +1,5 @@
-from typing import Union
+import warnings
+from typing import Optional, Union
 
 import numpy as np
 import torch as T
@@ -9,27 +10,78 @@ from pearll.common.enumerations import TrajectoryType
 from pearll.common.type_aliases import Trajectories
 
 
+def _rle_encode(observation: np.ndarray) -> np.ndarray:
+    """
+    Run-length encode an observation
+
+    :param observation: the observation to encode
+    :return: a packed structured array of the value and length of each run in the flattened
+        observation, or the flattened observation itself if encoding doesn't make it smaller
+    """
+    flat = observation.ravel()
+    if flat.size == 0:
+        return flat
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(flat)) + 1))
+    lengths = np.diff(np.append(starts, flat.size))
+    # Store the lengths in the smallest unsigned type that fits, fields are packed unaligned
+    encoded = np.empty(
+        len(starts),
+        dtype=[("value", flat.dtype), ("length", np.min_scalar_type(lengths.max()))],
+    )
+    if encoded.nbytes >= flat.nbytes:
+        return flat.copy()
+    encoded["value"] = flat[starts]
+    encoded["length"] = lengths
+    return encoded
+
+
+def _rle_decode(encoded: np.ndarray) -> np.ndarray:
+    """Decode a run-length encoded observation into its flattened form"""
+    if encoded.dtype.names is None:
+        return encoded
+    return np.repeat(encoded["value"], encoded["length"])
+
+
 class RolloutBuffer(BaseBuffer):
     """
     Rollout buffer handles sample collection and processing for on-policy algorithms.
 
     :param env: the environment
     :param buffer_size: max number of elements in the buffer
+    :param compression: optional compression for the stored observations, "rle" run-length
+        encodes each observation which saves memory for integer observations with long runs
+        of repeated values such as pixels. Float observations, and observations which
+        wouldn't get smaller, are stored uncompressed.
     """
 
+    supports_compression = True
+
     def __init__(
         self,
         env: Env,
         buffer_size: int,
+        compression: Optional[str] = None,
     ) -> None:
         super().__init__(
             env,
             buffer_size,
+            compression,
         )
-        self.next_observations = np.zeros(
-            (self.buffer_size,) + self.obs_shape,
-            dtype=env.observation_space.dtype,
+        if compression not in (None, "rle"):
+            raise ValueError(f"The compression {compression} is not supported")
+        self.compressed = compression == "rle" and not np.issubdtype(
+            env.observation_space.dtype, np.floating
         )
+        if compression == "rle" and not self.compressed:
+            warnings.warn("Float observations are stored without compression")
+        if self.compressed:
+            self.observations = np.empty(self.buffer_size, dtype=object)
+            self.next_observations = np.empty(self.buffer_size, dtype=object)
+        else:
+            self.next_observations = np.zeros(
+                (self.buffer_size,) + self.obs_shape,
+                dtype=env.observation_space.dtype,
+            )
         self._check_system_memory(
             self.observations,
             self.actions,
@@ -39,11 +91,47 @@ class RolloutBuffer(BaseBuffer):
         )
 
     def reset(self) -> None:
+        self._clear(self.next_observations)
         super().reset()
-        self.next_observations = np.zeros(
-            (self.buffer_size,) + self.obs_shape,
-            dtype=self.env.observation_space.dtype,
+
+    def _encode(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Run-length encode a batch of observations
+
+        :param observations: the observations (batch_size, *obs_shape)
+        :return: the encoded observations as an object array (batch_size,)
+        """
+        dtype = self.env.observation_space.dtype
+        encoded = np.empty(len(observations), dtype=object)
+        for i, observation in enumerate(observations):
+            encoded[i] = _rle_encode(np.asarray(observation, dtype=dtype))
+        return encoded
+
+    def _get_observations(
+        self, observations: np.ndarray, indices: Union[slice, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Get the stored observations at the indices, decoding them if compressed
+
+        :param observations: the stored observations or next observations
+        :param indices: the buffer indices to get
+        :return: the observations (batch_size, *obs_shape)
+        """
+        if not self.compressed:
+            return observations[indices]
+        # Positions which haven't been written to yet decode to zeros like the uncompressed buffer
+        empty = np.zeros(
+            int(np.prod(self.obs_shape)), dtype=self.env.observation_space.dtype
         )
+        decoded = [
+            empty if encoded is None else _rle_decode(encoded)
+            for encoded in observations[indices]
+        ]
+        if not decoded:
+            return np.zeros(
+                (0,) + self.obs_shape, dtype=self.env.observation_space.dtype
+            )
+        return np.stack(decoded).reshape((-1,) + self.obs_shape)
 
     def add_trajectory(
         self,
@@ -53,6 +141,10 @@ class RolloutBuffer(BaseBuffer):
         next_observation: np.ndarray,
         done: Union[bool, np.ndarray],
     ) -> None:
+        if self.compressed:
+            observation, next_observation = self._encode(
+                [observation, next_observation]
+            )
         self.observations[self.pos] = observation
         self.next_observations[self.pos] = next_observation
         self.actions[self.pos] = np.array(action).reshape(*self.actions.shape[1:])
@@ -64,6 +156,34 @@ class RolloutBuffer(BaseBuffer):
             self.full = True
             self.pos = 0
 
+    def add_batch_trajectories(
+        self,
+        observations: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_observations: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        positions = self._batch_positions(len(observations))
+        batch_size = len(positions)
+        # Only the latest trajectories fit if the batch is larger than the buffer
+        observations, actions, rewards, next_observations, dones = (
+            np.asarray(data)[-batch_size:]
+            for data in (observations, actions, rewards, next_observations, dones)
+        )
+        if self.compressed:
+            observations = self._encode(observations)
+            next_observations = self._encode(next_observations)
+        self.observations[positions] = observations
+        self.next_observations[positions] = next_observations
+        self.actions[positions] = np.reshape(
+            actions, (batch_size,) + self.actions.shape[1:]
+        )
+        self.rewards[positions] = np.reshape(
+            rewards, (batch_size,) + self.rewards.shape[1:]
+        )
+        self.dones[positions] = np.reshape(dones, (batch_size,) + self.dones.shape[1:])
+
     def sample(
         self,
         batch_size: int,
@@ -83,10 +203,14 @@ class RolloutBuffer(BaseBuffer):
         start_idx = np.random.randint(0, (upper_bound + 1) - batch_size)
         last_idx = start_idx + batch_size
 
-        observations = self.observations[start_idx:last_idx]
+        observations = self._get_observations(
+            self.observations, slice(start_idx, last_idx)
+        )
         actions = self.actions[start_idx:last_idx]
         rewards = self.rewards[start_idx:last_idx]
-        next_observations = self.next_observations[start_idx:last_idx]
+        next_observations = self._get_observations(
+            self.next_observations, slice(start_idx, last_idx)
+        )
         dones = self.dones[start_idx:last_idx]
 
         return self._transform_samples(
@@ -107,10 +231,10 @@ class RolloutBuffer(BaseBuffer):
         else:
             batch_inds = np.arange(start_idx, self.pos)
 
-        observations = self.observations[batch_inds]
+        observations = self._get_observations(self.observations, batch_inds)
         actions = self.actions[batch_inds]
         rewards = self.rewards[batch_inds]
-        next_observations = self.next_observations[batch_inds]
+        next_observations = self._get_observations(self.next_observations, batch_inds)
         dones = self.dones[batch_inds]
 
         return self._transform_samples(
@@ -123,9 +247,11 @@ class RolloutBuffer(BaseBuffer):
         return self._transform_samples(
             flatten_env=flatten_env,
             dtype=dtype,
-            observations=self.observations[: self.pos],
+            observations=self._get_observations(self.observations, slice(self.pos)),
             actions=self.actions[: self.pos],
             rewards=self.rewards[: self.pos],
-            next_observations=self.next_observations[: self.pos],
+            next_observations=self._get_observations(
+                self.next_observations, slice(self.pos)
+            ),
             dones=self.dones[: self.pos],
         )
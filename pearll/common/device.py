@@ -0,0 +1,30 @@
+"""Device helpers, kept free of other pearll imports so the settings module can use them"""
+
+from typing import Union
+
+import torch as T
+
+
+def get_device(device: Union[T.device, str]) -> T.device:
+    """
+    Retrieve PyTorch device.
+    It checks that the requested device is available first.
+    For now, it supports only cpu and cuda.
+
+    :param device: One for 'auto', 'cuda', 'cpu'
+    :return:
+    """
+    if isinstance(device, T.device):
+        return device
+
+    # Cuda by default
+    if device == "auto":
+        device = "cuda"
+    # Force conversion to th.device
+    device = T.device(device)
+
+    # Cuda not available
+    if device.type == T.device("cuda").type and not T.cuda.is_available():
+        return T.device("cpu")
+
+    return device
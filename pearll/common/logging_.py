@@ -53,7 +53,7 @@ class Logger(object):
         self.entropies = []
         self.rewards = []
         # Keep track of which environments have completed an episode
-        self.episode_dones = np.array([False for _ in range(num_envs)])
+        self.episode_dones = np.zeros(num_envs, dtype=bool)
 
     def reset_log(self) -> None:
         self.actor_losses = []
@@ -61,7 +61,7 @@ class Logger(object):
         self.divergences = []
         self.entropies = []
         self.rewards = []
-        self.episode_dones = np.array([False for _ in range(self.num_envs)])
+        self.episode_dones.fill(False)
 
     def add_train_log(self, train_log: Log) -> None:
         if train_log.actor_loss is not None:
@@ -78,7 +78,7 @@ class Logger(object):
         if isinstance(reward, (float, np.floating, int)):
             self.rewards.append(reward)
         elif isinstance(reward, np.ndarray):
-            log_reward = reward[np.where(self.episode_dones == False)[0]].mean()
+            log_reward = reward[~self.episode_dones].mean()
             if not np.isnan(log_reward):
                 self.rewards.append(log_reward)
         else:
@@ -92,8 +92,8 @@ class Logger(object):
 
         :param done: done array from the environment
         """
-        self.episode_dones = np.logical_or(self.episode_dones, done)
-        return np.all(self.episode_dones)
+        np.logical_or(self.episode_dones, done, out=self.episode_dones)
+        return self.episode_dones.all()
 
     def _make_episode_log(self) -> Log:
         """Make an episode log out of the collected stats"""
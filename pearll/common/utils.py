@@ -1,41 +1,75 @@
 import random
 from dataclasses import asdict
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 import numpy as np
 import torch as T
+import torch.distributed as dist
 from gym import Env, spaces
 
 from pearll import settings
+from pearll.common.device import get_device  # noqa: F401
 
 
-def get_device(device: Union[T.device, str]) -> T.device:
-    """
-    Retrieve PyTorch device.
-    It checks that the requested device is available first.
-    For now, it supports only cpu and cuda.
+def is_distributed() -> bool:
+    """Check whether a torch.distributed process group has been initialized"""
+    return dist.is_available() and dist.is_initialized()
 
-    :param device: One for 'auto', 'cuda', 'cpu'
-    :return:
-    """
-    if isinstance(device, T.device):
-        return device
 
-    # Cuda by default
-    if device == "auto":
-        device = "cuda"
-    # Force conversion to th.device
-    device = T.device(device)
+def broadcast_module_state(*modules: T.nn.Module) -> None:
+    """
+    Broadcast the parameters and buffers of the modules from rank 0 so that every
+    process starts from the same weights. Does nothing outside of distributed training.
 
-    # Cuda not available
-    if device.type == T.device("cuda").type and not T.cuda.is_available():
-        return T.device("cpu")
+    :param modules: the modules to synchronize
+    """
+    if not is_distributed():
+        return
+    seen = set()
+    for module in modules:
+        for tensor in module.state_dict(keep_vars=True).values():
+            if id(tensor) in seen:
+                continue
+            seen.add(id(tensor))
+            dist.broadcast(tensor.data, src=0)
+
+
+def all_reduce_gradients(parameters: Iterable[T.nn.Parameter]) -> None:
+    """
+    Average the gradients of the parameters across all processes. The gradients are
+    flattened into a single buffer so only one collective is launched per call.
+    Does nothing outside of distributed training.
 
-    return device
+    :param parameters: the parameters whose gradients should be averaged
+    """
+    if not is_distributed():
+        return
+    grads = [p.grad for p in parameters if p.grad is not None]
+    if not grads:
+        return
+    flat_grads = T.cat([grad.reshape(-1) for grad in grads])
+    dist.all_reduce(flat_grads)
+    flat_grads /= dist.get_world_size()
+    offset = 0
+    for grad in grads:
+        numel = grad.numel()
+        grad.copy_(flat_grads[offset : offset + numel].view_as(grad))
+        offset += numel
+
+
+def to_torch(*data, out: Optional[T.Tensor] = None) -> Union[Tuple[T.Tensor], T.Tensor]:
+    """
+    Convert to torch tensors
 
+    :param data: the data to convert
+    :param out: optional host tensor to stage a single input through. If it's in pinned
+        memory, the copy to the device can run asynchronously.
+    """
+    if out is not None:
+        assert len(data) == 1, "Only a single input can be staged through `out`"
+        out.copy_(T.as_tensor(data[0]))
+        return out.to(settings.DEVICE, non_blocking=True)
 
-def to_torch(*data) -> Union[Tuple[T.Tensor], T.Tensor]:
-    """Convert to torch tensors"""
     result = [None] * len(data)
     for i, el in enumerate(data):
         if isinstance(el, np.ndarray):
@@ -50,6 +50,8 @@ class Critic(T.nn.Module):
     :param head: the head network
     :param create_target: whether to create a target network
     :param polyak_coeff: the polyak coefficient for the target network
+    :param quantize_target: whether to run the target network forward pass with int8 dynamically
+        quantized linear layers, only applies to batched tensor inputs on the CPU
     """
 
     def __init__(
@@ -59,9 +61,13 @@ class Critic(T.nn.Module):
         head: BaseCriticHead,
         create_target: bool = False,
         polyak_coeff: float = 0.995,
+        quantize_target: bool = False,
     ):
         super().__init__()
         self.polyak_coeff = polyak_coeff
+        self.quantize_target = quantize_target
+        # Quantized copy of the target network, rebuilt lazily after the targets change
+        self._quantized_target = None
         self.model = Model(encoder, torso, head)
         self.state_info = {}
         self.make_state_info()
@@ -113,6 +119,7 @@ class Critic(T.nn.Module):
     def assign_targets(self) -> None:
         """Assign the target parameters"""
         self.target.load_state_dict(self.model.state_dict())
+        self._quantized_target = None
 
     def update_targets(self) -> None:
         """Update the target parameters"""
@@ -120,6 +127,17 @@ class Critic(T.nn.Module):
         for online, target in zip(self.model.parameters(), self.target.parameters()):
             target.data.mul_(self.polyak_coeff)
             target.data.add_((1 - self.polyak_coeff) * online.data)
+        self._quantized_target = None
+
+    def _get_quantized_target(self) -> T.nn.Module:
+        """Get the int8 quantized target network, quantizing it if the targets have changed"""
+        if self._quantized_target is None:
+            quantized_target = T.quantization.quantize_dynamic(
+                self.target, {T.nn.Linear}, dtype=T.qint8
+            )
+            # Bypass module registration so the quantized copy stays out of the state dict
+            object.__setattr__(self, "_quantized_target", quantized_target)
+        return self._quantized_target
 
     def forward_target(
         self, observations: Tensor, actions: Optional[Tensor] = None
@@ -130,6 +148,15 @@ class Critic(T.nn.Module):
         :param observations: the observations
         :param actions: the optional actions
         """
+        # Quantized linear layers only accept batched inputs
+        if (
+            self.quantize_target
+            and settings.DEVICE.type == "cpu"
+            and isinstance(observations, T.Tensor)
+            and observations.dim() > 1
+        ):
+            with T.no_grad():
+                return self._get_quantized_target()(observations, actions)
         return self.target(observations, actions)
 
     def forward(
@@ -254,8 +281,11 @@ class Dummy(Actor):
         self.state = np.array(state) if state is not None else np.array(space.sample())
 
     def set_state(self, state: np.ndarray) -> "Dummy":
-        """Set the state of the individual"""
-        self.state = np.array(state)
+        """Set the state of the individual, upcasting reduced precision population states"""
+        state = np.array(state)
+        if np.issubdtype(state.dtype, np.floating) and state.itemsize < 4:
+            state = state.astype(np.float32)
+        self.state = state
         return self
 
     def numpy(self) -> np.ndarray:
@@ -340,6 +370,10 @@ class ActorCritic(T.nn.Module):
             population_distribution=actor_dist,
             population_std=population_settings.actor_std,
         )
+        # The population states are kept in one contiguous array of shape (population_size, D)
+        # so the evolutionary updaters can read and write them without visiting each individual
+        self.population_dtype = population_settings.dtype
+        self._actor_population = np.stack([actor.numpy() for actor in self.actors])
         self.mean_critic = None
         self.normal_dist_critic = None
         self.critics = self.initialize_population(
@@ -348,6 +382,11 @@ class ActorCritic(T.nn.Module):
             population_distribution=critic_dist,
             population_std=population_settings.critic_std,
         )
+        self._critic_population = np.stack([critic.numpy() for critic in self.critics])
+        if self.population_dtype is not None:
+            # Load the reduced precision states so the networks match the stored population
+            self.set_actors_state(self._actor_population)
+            self.set_critics_state(self._critic_population)
         if self.actor.model.encoder == self.critic.model.encoder:
             assert self.num_critics == self.num_actors
             for actor, critic in zip(self.actors, self.critics):
@@ -407,24 +446,52 @@ class ActorCritic(T.nn.Module):
 
         return [copy.deepcopy(model).set_state(ind) for ind in population]
 
+    def _write_population(
+        self, population: np.ndarray, state: np.ndarray
+    ) -> np.ndarray:
+        """
+        Write the leading individuals of a contiguous population array.
+
+        :param population: the population array of shape (population_size, D)
+        :param state: the new states of shape (num_individuals, D)
+        :return: the population array, cast to the population dtype if the states are floating
+            point, otherwise upcast if it can't hold the new states exactly
+        """
+        dtype = np.result_type(population, state)
+        if self.population_dtype is not None and np.issubdtype(dtype, np.floating):
+            dtype = np.dtype(self.population_dtype)
+        elif np.can_cast(state.dtype, population.dtype):
+            dtype = population.dtype
+        if dtype != population.dtype:
+            population = population.astype(dtype)
+        population[: len(state)] = state
+        return population
+
     def numpy_actors(self) -> np.ndarray:
         """Get the numpy representation of the actor population."""
-        return np.array([ind.numpy() for ind in self.actors])
+        return self._actor_population.copy()
 
     def numpy_critics(self) -> np.ndarray:
         """Get the numpy representation of the critic population."""
-        return np.array([ind.numpy() for ind in self.critics])
+        return self._critic_population.copy()
 
     def set_actors_state(self, state: np.ndarray) -> "ActorCritic":
         """Set the state of the actors"""
+        state = np.asarray(state)
         state = state[np.newaxis] if state.ndim == 1 else state
-        [actor.set_state(s) for s, actor in zip(state, self.actors)]
+        self._actor_population = self._write_population(self._actor_population, state)
+        [actor.set_state(s) for s, actor in zip(self._actor_population, self.actors)]
         return self
 
     def set_critics_state(self, state: np.ndarray) -> "ActorCritic":
         """Set the state of the critics"""
+        state = np.asarray(state)
         state = state[np.newaxis] if state.ndim == 1 else state
-        [critic.set_state(s) for s, critic in zip(state, self.critics)]
+        self._critic_population = self._write_population(self._critic_population, state)
+        [
+            critic.set_state(s)
+            for s, critic in zip(self._critic_population, self.critics)
+        ]
         return self
 
     def assign_targets(self) -> None:
@@ -447,14 +514,12 @@ class ActorCritic(T.nn.Module):
         if self.num_actors == 1:
             self.actor = self.actors[0]
         else:
-            actor_states = [actor.state for actor in self.actors]
-            self.actor.set_state(np.mean(actor_states, axis=0))
+            self.actor.set_state(np.mean(self._actor_population, axis=0))
 
         if self.num_critics == 1:
             self.critic = self.critics[0]
         else:
-            critic_states = [critic.state for critic in self.critics]
-            self.critic.set_state(np.mean(critic_states, axis=0))
+            self.critic.set_state(np.mean(self._critic_population, axis=0))
 
     def action_distribution(
         self, observations: Tensor
@@ -476,12 +541,44 @@ class ActorCritic(T.nn.Module):
             stds = T.stack([dist.stddev for dist in distributions])
             return T.distributions.Normal(means, stds)
 
+    def _vmap_target_critics(
+        self, observations: T.Tensor, actions: Optional[T.Tensor] = None
+    ) -> T.Tensor:
+        """
+        Run the target critic population as a single vectorized forward pass.
+        The target parameters are restacked on every call so that updates made directly
+        through a member critic (e.g. `Critic.update_targets` or `load_state_dict`) are seen.
+
+        :param observations: the observations with a leading population axis
+        :param actions: the optional actions with a leading population axis
+        """
+        params, buffers = T.func.stack_module_state(
+            [critic.target for critic in self.critics]
+        )
+        base_model = self.critics[0].target
+
+        def forward_target(params, buffers, observation, action):
+            return T.func.functional_call(
+                base_model, (params, buffers), (observation, action)
+            )
+
+        return T.vmap(
+            forward_target, in_dims=(0, 0, 0, None if actions is None else 0)
+        )(params, buffers, observations, actions)
+
     def forward_target_critics(
         self, observations: Tensor, actions: Optional[Tensor] = None
     ) -> T.Tensor:
         """Get the population target critic outputs"""
         if self.num_critics == 1:
             return self.critics[0].forward_target(observations, actions)
+        elif (
+            hasattr(T, "func")
+            and not self.critics[0].quantize_target
+            and isinstance(observations, T.Tensor)
+            and (actions is None or isinstance(actions, T.Tensor))
+        ):
+            return self._vmap_target_critics(observations, actions)
         elif actions is None:
             return T.stack(
                 [
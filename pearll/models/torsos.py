@@ -2,8 +2,6 @@ from typing import List, Optional, Type
 
 import torch as T
 
-from pearll.common.type_aliases import Tensor
-
 
 class MLP(T.nn.Module):
     def __init__(
@@ -18,5 +16,5 @@ class MLP(T.nn.Module):
                 layers += [activation_fn()]
         self.model = T.nn.Sequential(*layers)
 
-    def forward(self, inputs: Tensor) -> T.Tensor:
+    def forward(self, inputs: T.Tensor) -> T.Tensor:
         return self.model(inputs)
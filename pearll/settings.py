@@ -1,41 +1,53 @@
 """This module holds settings objects to configure the other modules"""
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional, Tuple, Type, Union
 
 import numpy as np
 import torch as T
 from torch.optim.optimizer import Optimizer
 
+from pearll.common.device import get_device
 from pearll.common.enumerations import Distribution
-from pearll.common.utils import get_device
 
 DEVICE = get_device("auto")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Settings:
-    """Base class for settings objects"""
+    """
+    Base class for settings objects. Settings are frozen so a default instance shared between
+    agents can't be modified, subclasses should also be declared with `@dataclass(frozen=True)`.
+    """
 
     def filter_none(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        values = {field.name: getattr(self, field.name) for field in fields(self)}
+        return {k: v for k, v in values.items() if v is not None}
 
 
-@dataclass
+@dataclass(frozen=True)
 class MiscellaneousSettings(Settings):
     """
     Miscellaneous settings for base agent
 
     :param seed: random seed
     :param render: whether to render the environment
+    :param jit_critic: whether to compile the critic torsos with TorchScript
+    :param compile_critic: whether to compile the critic networks with `torch.compile`,
+        only applies for PyTorch versions which support it
+    :param compile_actor: whether to compile the actor networks with `torch.compile`,
+        only applies for PyTorch versions which support it
     """
 
     render: bool = False
     seed: Optional[int] = None
+    jit_critic: bool = False
+    compile_critic: bool = False
+    compile_actor: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class OptimizerSettings(Settings):
     """
     Settings for the model optimizers
@@ -52,7 +64,7 @@ class OptimizerSettings(Settings):
     max_grad: float = 0.5
 
 
-@dataclass
+@dataclass(frozen=True)
 class PopulationSettings(Settings):
     """
     Settings for the population initializer
@@ -63,6 +75,8 @@ class PopulationSettings(Settings):
     :param critic_distribution: distribution of the critic population
     :param actor_std: standard deviation of the actor population if normally distributed
     :param critic_std: standard deviation of the critic population if normally distributed
+    :param dtype: optional floating point dtype to store the population states with, e.g. "float16"
+        to halve their memory, the networks upcast the states when they're loaded
     """
 
     actor_population_size: int = 1
@@ -71,9 +85,10 @@ class PopulationSettings(Settings):
     critic_distribution: Optional[Union[str, Distribution]] = None
     actor_std: Optional[Union[float, np.ndarray]] = 1
     critic_std: Optional[Union[float, np.ndarray]] = 1
+    dtype: Optional[Union[str, np.dtype]] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExplorerSettings(Settings):
     """
     Settings for the action explorer
@@ -86,18 +101,22 @@ class ExplorerSettings(Settings):
     scale: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class BufferSettings(Settings):
     """
     Settings for buffers
 
     :buffer_size: max number of transitions to store at once in each environment
+    :param compression: optional compression for the stored observations, "rle" for run-length
+        encoding of integer observations (e.g. pixels), only supported by the RolloutBuffer and
+        other buffers raise a ValueError
     """
 
     buffer_size: int = int(1e6)
+    compression: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggerSettings(Settings):
     """
     Settings for the Logger
@@ -115,7 +134,7 @@ class LoggerSettings(Settings):
     verbose: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class MutationSettings(Settings):
     """
     Settings for the mutation process. Extend this class to add params for each mutation method.
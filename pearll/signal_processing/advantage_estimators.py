@@ -29,9 +29,13 @@ def generalized_advantage_estimate(
     """
     dones = 1 - dones
     batch_size = rewards.shape[0]
+    # Accumulate on the same device as the rewards to avoid host round trips
+    device = rewards.device if isinstance(rewards, T.Tensor) else None
 
     advantage = (
-        T.zeros(batch_size + 1) if rewards.ndim == 1 else T.zeros((batch_size + 1, 1))
+        T.zeros(batch_size + 1, device=device)
+        if rewards.ndim == 1
+        else T.zeros((batch_size + 1, 1), device=device)
     )
 
     for t in reversed(range(batch_size)):
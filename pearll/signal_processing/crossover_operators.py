@@ -5,24 +5,31 @@ from typing import Optional, Tuple
 import numpy as np
 
 
-def fit_gaussian(parents: np.ndarray, population_shape: Tuple[int, ...]) -> np.ndarray:
+def fit_gaussian(
+    parents: np.ndarray,
+    population_shape: Tuple[int, ...],
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
     Generates a new population given selected parents fitted to a Gaussian distribution.
 
     :param parents: the parent population
     :param population_shape: the shape of the new population
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the new population
     """
+    rng = np.random if rng is None else rng
     # Get the mean and standard deviation of the parents
     mean = np.mean(parents, axis=0)
     std = np.std(parents, axis=0)
 
-    return np.random.normal(mean, std, size=population_shape)
+    return rng.normal(mean, std, size=population_shape)
 
 
 def one_point_crossover(
     parents: np.ndarray,
     crossover_index: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Generates a new population from two parent individuals using one-point crossover.
@@ -30,36 +37,32 @@ def one_point_crossover(
 
     :param parents: the parent population
     :param crossover_index: crossover point index, if None then randomly selected
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the new population
     """
+    rng = np.random if rng is None else rng
     # Split population into parent pairs
-    pairs = np.array([[a, b] for a, b in zip(parents[::2], parents[1::2])])
+    num_pairs = parents.shape[0] // 2
+    first_parents = parents[: 2 * num_pairs : 2]
+    second_parents = parents[1 : 2 * num_pairs : 2]
 
     # Get crossover indices
     if crossover_index is None:
-        crossover_indices = np.random.choice(
+        crossover_indices = rng.choice(
             np.arange(parents.shape[1]),
-            size=pairs.shape[0],
+            size=num_pairs,
         )
     else:
-        crossover_indices = np.full(pairs.shape[0], crossover_index)
-
-    # Perform crossover
-    for i, pair in enumerate(pairs):
-        pairs[i] = [
-            np.concatenate(
-                (pair[0][: crossover_indices[i]], pair[1][crossover_indices[i] :]),
-                axis=0,
-            ),
-            np.concatenate(
-                (pair[1][: crossover_indices[i]], pair[0][crossover_indices[i] :]),
-                axis=0,
-            ),
-        ]
-    new_population = np.concatenate(pairs, axis=0)
+        crossover_indices = np.full(num_pairs, crossover_index)
 
-    # Account for odd parent population size
-    if parents.shape[0] % 2 != 0:
-        new_population = np.concatenate((new_population, [parents[-1]]), axis=0)
+    # Perform crossover for all pairs at once, the genes before each crossover index are kept
+    # from the first parent and the rest are swapped in from the second parent
+    mask = np.arange(parents.shape[1]) < crossover_indices[:, np.newaxis]
+    new_population = parents.copy()
+    new_population[: 2 * num_pairs : 2] = np.where(mask, first_parents, second_parents)
+    new_population[1 : 2 * num_pairs : 2] = np.where(
+        mask, second_parents, first_parents
+    )
 
+    # An odd parent population size leaves the last parent unchanged
     return new_population
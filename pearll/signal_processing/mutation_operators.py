@@ -3,6 +3,8 @@ Methods for mutating a population
 https://www.tutorialspoint.com/genetic_algorithms/genetic_algorithms_mutation.htm
 """
 
+from typing import Optional
+
 import numpy as np
 from gym import Space
 from gym.spaces.discrete import Discrete
@@ -14,16 +16,19 @@ from pearll.common.utils import get_space_range
 def _sample_indices(
     population: np.ndarray,
     mutation_rate: float = 0.1,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Samples mutation indices from a population.
 
     :param population: the population of individuals to mutate
     :param mutation_rate: the probability of mutating an individual
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the population indices to mutate
     """
+    rng = np.random if rng is None else rng
     # Get indices of individuals to mutate
-    mutation_indices = np.random.choice(
+    mutation_indices = rng.choice(
         np.arange(population.shape[0]),
         size=int(population.shape[0] * mutation_rate),
         replace=False,
@@ -37,6 +42,7 @@ def gaussian_mutation(
     action_space: Space,
     mutation_rate: float = 0.1,
     mutation_std: float = 0.5,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Mutates a population using a Gaussian mutation operator.
@@ -45,16 +51,19 @@ def gaussian_mutation(
     :param action_space: the action space of the environment
     :param mutation_rate: the probability of mutating an individual
     :param mutation_std: the standard deviation of the Gaussian distribution used to mutate an individual
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the mutated population
     """
+    rng = np.random if rng is None else rng
     space_range = get_space_range(action_space)
     # Get indices of individuals to mutate
-    mutation_indices = _sample_indices(population, mutation_rate)
+    mutation_indices = _sample_indices(population, mutation_rate, rng)
 
     # Mutate individuals
     new_population = population.copy().astype(np.float32)
-    for i in mutation_indices:
-        new_population[i] += np.random.normal(0, mutation_std, population.shape[-1])
+    new_population[mutation_indices] += rng.normal(
+        0, mutation_std, (mutation_indices.shape[0], population.shape[-1])
+    )
 
     # Discretize population as required
     if isinstance(action_space, (Discrete, MultiDiscrete)):
@@ -67,6 +76,7 @@ def uniform_mutation(
     population: np.ndarray,
     action_space: Space,
     mutation_rate: float = 0.1,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Mutates a population using a uniform mutation operator.
@@ -74,16 +84,19 @@ def uniform_mutation(
     :param population: the population of individuals to mutate
     :param action_space: the action space of the environment
     :param mutation_rate: the probability of mutating an individual
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the mutated population
     """
+    rng = np.random if rng is None else rng
     space_range = get_space_range(action_space)
     # Get indices of individuals to mutate
-    mutation_indices = _sample_indices(population, mutation_rate)
+    mutation_indices = _sample_indices(population, mutation_rate, rng)
 
     # Mutate individuals
     new_population = population.copy().astype(np.float32)
-    for i in mutation_indices:
-        new_population[i] += np.random.uniform(-1, 1, population.shape[1])
+    new_population[mutation_indices] += rng.uniform(
+        -1, 1, (mutation_indices.shape[0], population.shape[1])
+    )
 
     # Discretize population as required
     if isinstance(action_space, (Discrete, MultiDiscrete)):
@@ -22,8 +22,10 @@ def TD_lambda(
     batch_size = rewards.shape[0]
     td_lambda = rewards.shape[1]
     last_dones = 1 - last_dones
+    # Accumulate on the same device as the rewards to avoid host round trips
+    device = rewards.device if isinstance(rewards, T.Tensor) else None
 
-    returns = T.zeros(size=(batch_size,), dtype=T.float32)
+    returns = T.zeros(size=(batch_size,), dtype=T.float32, device=device)
     for i in range(td_lambda):
         returns += (gamma ** i) * rewards[:, i]
 
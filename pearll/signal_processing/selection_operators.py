@@ -1,5 +1,7 @@
 """Methods for selecting individuals in a population to evolve for the next algorithm iteration"""
 
+from typing import Optional
+
 import numpy as np
 
 
@@ -23,6 +25,7 @@ def tournament_selection(
     fitness_scores: np.ndarray,
     tournament_size: int = 2,
     probability: float = 0.8,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Selects individuals for the next algorithm iteration using tournament selection.
@@ -32,8 +35,10 @@ def tournament_selection(
     :param fitness_scores: the fitness scores of the individuals in the population
     :param tournament_size: the number of individuals to select from the population
     :param probability: the probability of selecting the best individual for each tournament
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the selected individuals
     """
+    rng = np.random if rng is None else rng
     # Need a combined data structure to keep track of the fitness scores of the individuals after sorting
     combined_data = {
         fitness_score: individual
@@ -52,7 +57,7 @@ def tournament_selection(
     probabilities[0] += residual
 
     # Create the tournament
-    tournament_fitness = np.random.choice(
+    tournament_fitness = rng.choice(
         sorted_fitness,
         size=(population.shape[0], tournament_size),
         p=probabilities,
@@ -66,20 +71,29 @@ def tournament_selection(
 
 
 def roulette_selection(
-    population: np.ndarray, fitness_scores: np.ndarray
+    population: np.ndarray,
+    fitness_scores: np.ndarray,
+    rng: Optional[np.random.Generator] = None,
 ) -> np.ndarray:
     """
     Selects individuals for the next algorithm iteration using roulette selection.
 
     :param population: the population of individuals to select from
     :param fitness_scores: the fitness scores of the individuals in the population
+    :param rng: optional random number generator, defaults to the global numpy random state
     :return: the selected individuals
     """
+    rng = np.random if rng is None else rng
     # Calculate the probabilities of selecting an individual
-    fitness_scores = fitness_scores / np.sum(fitness_scores)
+    probabilities = fitness_scores / np.sum(fitness_scores)
+    if not np.all(probabilities >= 0):
+        raise ValueError("The fitness scores must all share the same sign")
+    cdf = np.cumsum(probabilities, dtype=np.float64)
+    cdf /= cdf[-1]
 
-    # Select individuals based on the probabilities
-    selected_indices = np.random.choice(
-        population.shape[0], size=population.shape[0], p=fitness_scores
+    # Select individuals by binary searching uniform samples in the cumulative probabilities,
+    # this draws the same samples as `choice(..., p=probabilities)`
+    selected_indices = np.searchsorted(
+        cdf, rng.random(population.shape[0]), side="right"
     )
     return population[selected_indices]
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Iterator, Type, Union
+from functools import partial
+from typing import List, Type, Union
 
 import torch as T
 from torch.distributions import kl_divergence
 from torch.nn.parameter import Parameter
 
 from pearll.common.type_aliases import UpdaterLog
+from pearll.common.utils import all_reduce_gradients
 from pearll.models.actor_critics import Actor, ActorCritic
 
 
@@ -27,10 +29,10 @@ class BaseActorUpdater(ABC):
 
     def _get_model_parameters(
         self, model: Union[Actor, ActorCritic]
-    ) -> Iterator[Parameter]:
+    ) -> List[Parameter]:
         """Get the actor model parameters"""
         if isinstance(model, Actor):
-            return model.parameters()
+            return list(model.parameters())
         else:
             params = []
             for actor in model.actors:
@@ -41,11 +43,17 @@ class BaseActorUpdater(ABC):
         self,
         optimizer: T.optim.Optimizer,
         loss: T.Tensor,
-        actor_parameters: Iterator[Parameter],
+        actor_parameters: List[Parameter],
     ) -> None:
-        """Run an optimization step"""
+        """
+        Run an optimization step. Under torch.distributed the gradients are averaged
+        across processes before clipping and stepping.
+        """
         optimizer.zero_grad(set_to_none=True)
         loss.backward()
+        all_reduce_gradients(
+            param for group in optimizer.param_groups for param in group["params"]
+        )
         if self.max_grad > 0:
             T.nn.utils.clip_grad_norm_(actor_parameters, self.max_grad)
         optimizer.step()
@@ -239,6 +247,31 @@ class SoftPolicyGradient(BaseActorUpdater):
     ) -> None:
         super().__init__(optimizer_class=optimizer_class, max_grad=max_grad)
         self.squashed_output = squashed_output
+        self._critic_values = None
+        self._model_id = None
+
+    def bind(self, model: ActorCritic) -> "SoftPolicyGradient":
+        """
+        Resolve how the critic values are computed for the model once, rather than
+        checking the model's critics on every update.
+
+        :param model: an actor critic model with either 1 or 2 critic networks
+        :return: the bound updater
+        """
+        if hasattr(model, "critic2"):
+            self._critic_values = partial(self._min_twin_critic_values, model)
+        else:
+            self._critic_values = model.forward_critics
+        self._model_id = id(model)
+        return self
+
+    @staticmethod
+    def _min_twin_critic_values(
+        model: ActorCritic, observations: T.Tensor, actions: T.Tensor
+    ) -> T.Tensor:
+        """Take the minimum of the twin critic values"""
+        values1, values2 = model.forward_critics(observations, actions)
+        return T.min(values1, values2)
 
     def __call__(
         self,
@@ -267,12 +300,10 @@ class SoftPolicyGradient(BaseActorUpdater):
         log_probs = distributions.log_prob(actions)
         entropy = distributions.entropy().mean()
 
+        if id(model) != self._model_id:
+            self.bind(model)
         with T.no_grad():
-            if hasattr(model, "critic2"):
-                values1, values2 = model.forward_critics(observations, actions)
-                values = T.min(values1, values2)
-            else:
-                values = model.forward_critics(observations, actions)
+            values = self._critic_values(observations, actions)
 
         loss = (entropy_coeff * log_probs - values).mean()
 
@@ -1,13 +1,24 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import Iterator, Type, Union
+from contextlib import nullcontext
+from typing import ContextManager, Dict, List, Type, Union
 
 import torch as T
 from torch.nn.parameter import Parameter
 
+from pearll import settings
 from pearll.common.type_aliases import UpdaterLog
+from pearll.common.utils import all_reduce_gradients
 from pearll.models.actor_critics import ActorCritic, Critic
 
 
+@T.jit.script
+def _mse_loss(predictions: T.Tensor, targets: T.Tensor) -> T.Tensor:
+    """Mean squared error scripted so the subtraction, square and mean run as one graph"""
+    difference = predictions - targets
+    return (difference * difference).mean()
+
+
 class BaseCriticUpdater(ABC):
     """
     The base class with pre-defined methods for derived classes
@@ -15,39 +26,121 @@ class BaseCriticUpdater(ABC):
     :param loss_class: The loss class to use e.g. MSE
     :param optimizer_class: the type of optimizer to use, defaults to Adam
     :param max_grad: maximum gradient clip value, defaults to no clipping with a value of 0
+    :param mixed_precision: whether to run the forward pass and loss in bfloat16 autocast,
+        master weights and optimizer state are kept in float32
     """
 
+    __slots__ = (
+        "loss_class",
+        "optimizer_class",
+        "max_grad",
+        "mixed_precision",
+        "_optimizer",
+        "_parameters",
+        "_model_id",
+    )
+
     def __init__(
         self,
         loss_class: T.nn.Module = T.nn.MSELoss(),
         optimizer_class: Type[T.optim.Optimizer] = T.optim.Adam,
         max_grad: float = 0,
+        mixed_precision: bool = False,
     ) -> None:
         self.loss_class = loss_class
         self.optimizer_class = optimizer_class
         self.max_grad = max_grad
+        self.mixed_precision = mixed_precision
+        self._optimizer = None
+        self._parameters = None
+        self._model_id = None
+
+    def _autocast(self) -> ContextManager:
+        """Autocast context for the forward pass and loss, a no-op unless mixed precision is on"""
+        if not self.mixed_precision:
+            return nullcontext()
+        # bfloat16 has the same exponent range as float32 so no gradient scaling is needed
+        return T.autocast(device_type=settings.DEVICE.type, dtype=T.bfloat16)
+
+    def _loss(self, predictions: T.Tensor, targets: T.Tensor) -> T.Tensor:
+        """Calculate the regression loss, using the scripted MSE for the default loss"""
+        if (
+            type(self.loss_class) is T.nn.MSELoss
+            and self.loss_class.reduction == "mean"
+        ):
+            return _mse_loss(predictions, targets)
+        return self.loss_class(predictions, targets)
 
     def _get_model_parameters(
         self, model: Union[Critic, ActorCritic]
-    ) -> Iterator[Parameter]:
-        """Get the critic model parameters"""
-        if isinstance(model, Critic):
-            return model.parameters()
+    ) -> List[Parameter]:
+        """
+        Get the critic model parameters. They're materialized once per model so the same
+        list can be iterated by the optimizer and gradient clipping on every step.
+        """
+        model_id = id(model)
+        if model_id != self._model_id:
+            if isinstance(model, Critic):
+                self._parameters = list(model.parameters())
+            else:
+                self._parameters = []
+                for critic in model.critics:
+                    self._parameters.extend(critic.model.parameters())
+            self._model_id = model_id
+            self._optimizer = None
+        return self._parameters
+
+    def _optimizer_kwargs(self) -> Dict[str, bool]:
+        """
+        Select the multi-tensor implementation of the optimizer when running on the GPU,
+        preferring the fused kernel, so the step isn't a kernel launch per parameter.
+        Optimizers and PyTorch versions without these options are left as they are.
+        """
+        if settings.DEVICE.type != "cuda":
+            return {}
+        optimizer_params = inspect.signature(self.optimizer_class).parameters
+        if "fused" in optimizer_params:
+            return {"fused": True}
+        elif "foreach" in optimizer_params:
+            return {"foreach": True}
+        return {}
+
+    def _get_optimizer(
+        self, model: Union[Critic, ActorCritic], learning_rate: float
+    ) -> T.optim.Optimizer:
+        """
+        Get the optimizer for the model. The optimizer is only rebuilt when a different model
+        is passed in so that its state (e.g. Adam moments) carries over between steps.
+
+        :param model: the model on which the optimization should be run
+        :param learning_rate: the learning rate for the optimizer algorithm
+        :return: the optimizer
+        """
+        parameters = self._get_model_parameters(model)
+        if self._optimizer is None:
+            self._optimizer = self.optimizer_class(
+                parameters, lr=learning_rate, **self._optimizer_kwargs()
+            )
         else:
-            params = []
-            for critic in model.critics:
-                params.extend(critic.model.parameters())
-            return params
+            for param_group in self._optimizer.param_groups:
+                param_group["lr"] = learning_rate
+        return self._optimizer
 
     def run_optimizer(
         self,
         optimizer: T.optim.Optimizer,
         loss: T.Tensor,
-        critic_parameters: Iterator[Parameter],
+        critic_parameters: List[Parameter],
     ) -> None:
-        """Run an optimization step"""
+        """
+        Run an optimization step. Under torch.distributed the gradients are averaged
+        across processes before clipping and stepping.
+        """
         optimizer.zero_grad(set_to_none=True)
         loss.backward()
+        all_reduce_gradients(
+            param for group in optimizer.param_groups for param in group["params"]
+        )
         if self.max_grad > 0:
             T.nn.utils.clip_grad_norm_(critic_parameters, self.max_grad)
         optimizer.step()
@@ -64,16 +157,23 @@ class ValueRegression(BaseCriticUpdater):
     :param loss_class: the distance loss class for regression, defaults to MSE
     :param optimizer_class: the type of optimizer to use, defaults to Adam
     :param max_grad: maximum gradient clip value, defaults to no clipping with a value of 0
+    :param mixed_precision: whether to run the forward pass and loss in bfloat16 autocast
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         loss_class: T.nn.Module = T.nn.MSELoss(),
         optimizer_class: Type[T.optim.Optimizer] = T.optim.Adam,
         max_grad: float = 0,
+        mixed_precision: bool = False,
     ) -> None:
         super().__init__(
-            loss_class=loss_class, optimizer_class=optimizer_class, max_grad=max_grad
+            loss_class=loss_class,
+            optimizer_class=optimizer_class,
+            max_grad=max_grad,
+            mixed_precision=mixed_precision,
         )
 
     def __call__(
@@ -94,14 +194,15 @@ class ValueRegression(BaseCriticUpdater):
         :param loss_coeff: the coefficient for the value loss, defaults to 1
         """
         critic_parameters = self._get_model_parameters(model)
-        optimizer = self.optimizer_class(critic_parameters, lr=learning_rate)
+        optimizer = self._get_optimizer(model, learning_rate)
 
-        if isinstance(model, Critic):
-            values = model(observations)
-        else:
-            values = model.forward_critics(observations)
+        with self._autocast():
+            if isinstance(model, Critic):
+                values = model(observations)
+            else:
+                values = model.forward_critics(observations)
 
-        loss = loss_coeff * self.loss_class(values, returns)
+            loss = loss_coeff * self._loss(values, returns)
 
         self.run_optimizer(optimizer, loss, critic_parameters)
 
@@ -115,16 +216,23 @@ class ContinuousQRegression(BaseCriticUpdater):
     :param loss_class: the distance loss class for regression, defaults to MSE
     :param optimizer_class: the type of optimizer to use, defaults to Adam
     :param max_grad: maximum gradient clip value, defaults to no clipping with a value of 0
+    :param mixed_precision: whether to run the forward pass and loss in bfloat16 autocast
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         loss_class: T.nn.Module = T.nn.MSELoss(),
         optimizer_class: Type[T.optim.Optimizer] = T.optim.Adam,
         max_grad: float = 0,
+        mixed_precision: bool = False,
     ) -> None:
         super().__init__(
-            loss_class=loss_class, optimizer_class=optimizer_class, max_grad=max_grad
+            loss_class=loss_class,
+            optimizer_class=optimizer_class,
+            max_grad=max_grad,
+            mixed_precision=mixed_precision,
         )
 
     def __call__(
@@ -147,14 +255,15 @@ class ContinuousQRegression(BaseCriticUpdater):
         :param loss_coeff: the coefficient for the Q loss, defaults to 1
         """
         critic_parameters = self._get_model_parameters(model)
-        optimizer = self.optimizer_class(critic_parameters, lr=learning_rate)
+        optimizer = self._get_optimizer(model, learning_rate)
 
-        if isinstance(model, Critic):
-            q_values = model(observations, actions)
-        else:
-            q_values = model.forward_critics(observations, actions)
+        with self._autocast():
+            if isinstance(model, Critic):
+                q_values = model(observations, actions)
+            else:
+                q_values = model.forward_critics(observations, actions)
 
-        loss = loss_coeff * self.loss_class(q_values, returns)
+            loss = loss_coeff * self._loss(q_values, returns)
 
         self.run_optimizer(optimizer, loss, critic_parameters)
 
@@ -168,16 +277,23 @@ class DiscreteQRegression(BaseCriticUpdater):
     :param loss_class: the distance loss class for regression, defaults to MSE
     :param optimizer_class: the type of optimizer to use, defaults to Adam
     :param max_grad: maximum gradient clip value, defaults to no clipping with a value of 0
+    :param mixed_precision: whether to run the forward pass and loss in bfloat16 autocast
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         loss_class: T.nn.Module = T.nn.MSELoss(),
         optimizer_class: Type[T.optim.Optimizer] = T.optim.Adam,
         max_grad: float = 0,
+        mixed_precision: bool = False,
     ) -> None:
         super().__init__(
-            loss_class=loss_class, optimizer_class=optimizer_class, max_grad=max_grad
+            loss_class=loss_class,
+            optimizer_class=optimizer_class,
+            max_grad=max_grad,
+            mixed_precision=mixed_precision,
         )
 
     def __call__(
@@ -201,15 +317,16 @@ class DiscreteQRegression(BaseCriticUpdater):
         :param loss_coeff: the coefficient for the Q loss, defaults to 1
         """
         critic_parameters = self._get_model_parameters(model)
-        optimizer = self.optimizer_class(critic_parameters, lr=learning_rate)
+        optimizer = self._get_optimizer(model, learning_rate)
 
-        if isinstance(model, Critic):
-            q_values = model(observations)
-        else:
-            q_values = model.forward_critics(observations)
-        q_values = T.gather(q_values, dim=-1, index=actions_index.long())
+        with self._autocast():
+            if isinstance(model, Critic):
+                q_values = model(observations)
+            else:
+                q_values = model.forward_critics(observations)
+            q_values = T.gather(q_values, dim=-1, index=actions_index.long())
 
-        loss = loss_coeff * self.loss_class(q_values, returns)
+            loss = loss_coeff * self._loss(q_values, returns)
 
         self.run_optimizer(optimizer, loss, critic_parameters)
 
@@ -5,6 +5,7 @@ import torch as T
 from torch.nn import functional as F
 
 from pearll.common.type_aliases import UpdaterLog
+from pearll.common.utils import all_reduce_gradients
 from pearll.models.actor_critics import Model
 
 
@@ -27,9 +28,15 @@ class BaseDeepUpdater(ABC):
         loss: T.Tensor,
         model_parameters: Iterator[T.nn.Parameter],
     ) -> None:
-        """Run an optimization step"""
+        """
+        Run an optimization step. Under torch.distributed the gradients are averaged
+        across processes before clipping and stepping.
+        """
         optimizer.zero_grad(set_to_none=True)
         loss.backward()
+        all_reduce_gradients(
+            param for group in optimizer.param_groups for param in group["params"]
+        )
         if self.max_grad > 0:
             T.nn.utils.clip_grad_norm_(model_parameters, self.max_grad)
         optimizer.step()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 import torch as T
@@ -129,6 +129,7 @@ class GeneticUpdater(BaseEvolutionUpdater):
         crossover_operator: Optional[CrossoverFunc] = None,
         mutation_operator: Optional[MutationFunc] = None,
         elitism: float = 0.1,
+        num_epochs: int = 1,
     ) -> UpdaterLog:
         """
         Perform an optimization step
@@ -138,33 +139,155 @@ class GeneticUpdater(BaseEvolutionUpdater):
         :param crossover_operator: the crossover operator function
         :param mutation_operator: the mutation operator function
         :param elitism: fraction of the population to keep as elite
-        :return: the updater log
+        :param num_epochs: how many generations to evolve with the same rewards. The population
+            is read from and written to the networks once, with the generations run in numpy.
+        :return: the updater log, with the divergence summed and the entropy averaged over epochs
         """
         # Store elite population
         if self.population_type == "actor":
-            old_population = self.model.numpy_actors()
+            population = self.model.numpy_actors()
         elif self.population_type == "critic":
-            old_population = self.model.numpy_critics()
-        if elitism > 0:
-            num_elite = int(self.population_size * elitism)
+            population = self.model.numpy_critics()
+        # Too small a population or elitism fraction leaves no elite, note `[-0:]` would select
+        # the whole population rather than none of it
+        num_elite = int(self.population_size * elitism)
+        if num_elite > 0:
             elite_indices = np.argpartition(rewards, -num_elite)[-num_elite:]
-            elite_population = old_population[elite_indices]
+        # Equal rewards carry no signal to select on, so only explore with crossover and mutation
+        if np.ptp(rewards) == 0:
+            selection_operator = None
 
-        # Main update
-        if selection_operator is not None:
-            new_population = selection_operator(old_population, rewards)
-        if crossover_operator is not None:
-            new_population = crossover_operator(new_population)
-        if mutation_operator is not None:
-            new_population = mutation_operator(new_population, self.space)
-        if elitism > 0:
-            new_population[elite_indices] = elite_population
-        self.update_networks(new_population)
+        divergence = 0
+        entropy = 0
+        for _ in range(num_epochs):
+            old_population = population
+            if num_elite > 0:
+                elite_population = old_population[elite_indices]
 
-        # Calculate Log metrics
-        divergence = np.mean(np.abs(new_population - old_population))
-        entropy = np.mean(
-            np.abs(np.max(new_population, axis=0) - np.min(new_population, axis=0))
-        )
+            # Main update
+            population = old_population
+            if selection_operator is not None:
+                population = selection_operator(old_population, rewards)
+            if crossover_operator is not None:
+                population = crossover_operator(population)
+            if mutation_operator is not None:
+                population = mutation_operator(population, self.space)
+            if num_elite > 0:
+                population[elite_indices] = elite_population
+
+            # Calculate Log metrics
+            divergence += np.mean(np.abs(population - old_population))
+            entropy += np.mean(np.ptp(population, axis=0))
+        self.update_networks(population)
+
+        return UpdaterLog(divergence=divergence, entropy=entropy / num_epochs)
+
+
+class PBTUpdater(BaseEvolutionUpdater):
+    """
+    Updater for Population Based Training: https://arxiv.org/abs/1711.09846
+    The worst performing individuals exploit the best performing ones by copying their state
+    (truncation selection), then explore by perturbing the copied state.
+
+    In continuous spaces the copied states are scaled by one of `perturbation_factors`, scaling
+    can't move zeros so zero entries are instead shifted by the factor minus one (e.g. +/-0.2 for
+    the default factors). In discrete spaces scaling would be rounded away for small values and
+    never reach zero or flip signs, so each entry is instead stepped to a neighbouring value
+    (-1, 0 or +1). The explored states are clipped to the space range.
+
+    :param model: the actor critic model containing the population
+    :param population_type: the type of population to update, either "actor" or "critic"
+    :param truncation_ratio: fraction of the population to replace and to copy from, at most
+        half the population so the best individuals are never replaced
+    :param perturbation_factors: the factors to randomly scale the copied continuous states by
+    """
+
+    def __init__(
+        self,
+        model: ActorCritic,
+        population_type: str = "actor",
+        truncation_ratio: float = 0.2,
+        perturbation_factors: Tuple[float, ...] = (0.8, 1.2),
+    ) -> None:
+        super().__init__(model, population_type)
+        self.truncation_ratio = truncation_ratio
+        self.perturbation_factors = np.array(perturbation_factors)
+        self.num_truncated = max(1, int(self.population_size * truncation_ratio))
+        if self.num_truncated > self.population_size // 2:
+            raise ValueError(
+                f"Truncating {self.num_truncated} of {self.population_size} individuals would "
+                "overlap the best and worst individuals, the population must be at least twice "
+                "the size of the truncated individuals"
+            )
+
+    def __call__(
+        self,
+        rewards: np.ndarray,
+        selection_operator: Optional[SelectionFunc] = None,
+        crossover_operator: Optional[CrossoverFunc] = None,
+        mutation_operator: Optional[MutationFunc] = None,
+        elitism: float = 0.1,
+        num_epochs: int = 1,
+        rng: Optional[np.random.Generator] = None,
+    ) -> UpdaterLog:
+        """
+        Perform an optimization step. The arguments match `GeneticUpdater` so this can be
+        used as the GA updater, the selection and crossover operators and elitism are unused
+        since the exploit step is truncation selection and the best individuals are kept.
+
+        :param rewards: the rewards for the current population
+        :param selection_operator: unused
+        :param crossover_operator: unused
+        :param mutation_operator: optional mutation operator to further explore the copied states
+        :param elitism: unused
+        :param num_epochs: how many exploit and explore steps to run with the same rewards
+        :param rng: optional random number generator, defaults to the global numpy random state
+        :return: the updater log, with the divergence summed and the entropy averaged over epochs
+        """
+        rng = np.random if rng is None else rng
+        if self.population_type == "actor":
+            population = self.model.numpy_actors()
+        elif self.population_type == "critic":
+            population = self.model.numpy_critics()
+
+        num_truncated = self.num_truncated
+        worst_indices = np.argpartition(rewards, num_truncated - 1)[:num_truncated]
+        best_indices = np.argpartition(rewards, -num_truncated)[-num_truncated:]
+
+        divergence = 0
+        entropy = 0
+        for _ in range(num_epochs):
+            old_population = population
+            population = old_population.copy()
+
+            # Exploit
+            source_indices = rng.choice(best_indices, size=num_truncated)
+            new_individuals = old_population[source_indices]
+            # Explore
+            if isinstance(self.space, (Discrete, MultiDiscrete)):
+                new_individuals = new_individuals + rng.choice(
+                    np.array([-1, 0, 1]), size=new_individuals.shape
+                )
+            else:
+                factors = rng.choice(
+                    self.perturbation_factors, size=num_truncated
+                ).reshape((num_truncated,) + (1,) * (population.ndim - 1))
+                new_individuals = np.where(
+                    new_individuals == 0, factors - 1, new_individuals * factors
+                )
+            if mutation_operator is not None:
+                new_individuals = mutation_operator(new_individuals, self.space)
+
+            # Discretize and clip population as needed
+            if isinstance(self.space, (Discrete, MultiDiscrete)):
+                new_individuals = np.round(new_individuals).astype(np.int32)
+            population[worst_indices] = np.clip(
+                new_individuals, self.space_range[0], self.space_range[1]
+            )
+
+            # Calculate Log metrics
+            divergence += np.mean(np.abs(population - old_population))
+            entropy += np.mean(np.ptp(population, axis=0))
+        self.update_networks(population)
 
-        return UpdaterLog(divergence=divergence, entropy=entropy)
+        return UpdaterLog(divergence=divergence, entropy=entropy / num_epochs)
@@ -2,6 +2,7 @@ import shutil
 
 import gym
 import numpy as np
+import pytest
 import torch as T
 
 from pearll.agents.base_agents import BaseAgent
@@ -12,7 +13,7 @@ from pearll.models.actor_critics import Actor, ActorCritic, Critic
 from pearll.models.encoders import IdentityEncoder
 from pearll.models.heads import ContinuousQHead
 from pearll.models.torsos import MLP
-from pearll.settings import ExplorerSettings, LoggerSettings
+from pearll.settings import ExplorerSettings, LoggerSettings, MiscellaneousSettings
 
 
 class MockRLAgent(BaseAgent):
@@ -102,4 +103,115 @@ def test_deep_fit():
     assert vec_deep_agent.episode == 1
 
 
+def test_reset_env():
+    reset_counts = [0, 0]
+
+    def counting_reset(i, reset):
+        def wrapper():
+            reset_counts[i] += 1
+            return reset()
+
+        return wrapper
+
+    observation = envs.reset()
+    for i, sub_env in enumerate(envs.envs):
+        sub_env.reset = counting_reset(i, sub_env.reset)
+    # The first environment has just been auto-reset, so only the second should be reset
+    expected_observation = observation.copy()
+    vec_deep_agent._reset_env(observation, np.array([True, False]))
+    for sub_env in envs.envs:
+        del sub_env.reset
+    assert reset_counts == [0, 1]
+    # The caller's observation isn't modified in place
+    np.testing.assert_array_equal(observation, expected_observation)
+
+    class ScaledObservation(gym.vector.VectorEnvWrapper):
+        def __init__(self, env):
+            super().__init__(env)
+            # The base wrapper doesn't expose the wrapped spaces
+            gym.vector.VectorEnv.__init__(
+                self,
+                env.num_envs,
+                env.single_observation_space,
+                env.single_action_space,
+            )
+
+        def reset_wait(self, **kwargs):
+            return self.env.reset_wait(**kwargs) * 100
+
+    # Wrapped vector environments are reset through their wrappers
+    wrapped_envs = ScaledObservation(
+        gym.vector.make("Pendulum-v0", num_envs=2, asynchronous=False)
+    )
+    wrapped_agent = MockRLAgent(
+        env=wrapped_envs,
+        model=model,
+        buffer_class=ReplayBuffer,
+        logger_settings=LoggerSettings(tensorboard_log_path="runs/tests"),
+    )
+    observation = wrapped_envs.reset()
+    observation = wrapped_agent._reset_env(observation, np.array([True, False]))
+    assert np.abs(observation).max() > 1
+
+
+def test_jit_critic():
+    actor_torso = MLP(layer_sizes=[3, 64, 32], activation_fn=T.nn.ReLU)
+    critic_torso = MLP(layer_sizes=[3, 64, 32], activation_fn=T.nn.ReLU)
+    jit_model = ActorCritic(
+        actor=Actor(encoder, actor_torso, head),
+        critic=Critic(encoder, critic_torso, head),
+    )
+    observation = T.rand(3)
+    expected_value = jit_model.forward_critics(observation)
+
+    MockRLAgent(
+        env=env,
+        model=jit_model,
+        buffer_class=ReplayBuffer,
+        logger_settings=LoggerSettings(tensorboard_log_path="runs/tests"),
+        misc_settings=MiscellaneousSettings(jit_critic=True),
+    )
+
+    assert isinstance(jit_model.critics[0].model.torso, T.jit.ScriptModule)
+    assert not isinstance(jit_model.actors[0].model.torso, T.jit.ScriptModule)
+    T.testing.assert_close(jit_model.forward_critics(observation), expected_value)
+
+
+@pytest.mark.skipif(
+    not hasattr(T.nn.Module, "compile"), reason="torch.compile is unsupported"
+)
+def test_compile_critic():
+    compile_model = ActorCritic(
+        actor=Actor(encoder, torso, head), critic=Critic(encoder, torso, head)
+    )
+    MockRLAgent(
+        env=env,
+        model=compile_model,
+        buffer_class=ReplayBuffer,
+        logger_settings=LoggerSettings(tensorboard_log_path="runs/tests"),
+        misc_settings=MiscellaneousSettings(compile_critic=True),
+    )
+
+    # Compilation is lazy so only check the critic networks are marked for it
+    assert compile_model.critics[0].model._compiled_call_impl is not None
+    assert compile_model.actors[0].model._compiled_call_impl is None
+    assert (
+        compile_model.critics[0].state_dict().keys()
+        == Critic(encoder, torso, head).state_dict().keys()
+    )
+
+    compile_model = ActorCritic(
+        actor=Actor(encoder, torso, head), critic=Critic(encoder, torso, head)
+    )
+    MockRLAgent(
+        env=env,
+        model=compile_model,
+        buffer_class=ReplayBuffer,
+        logger_settings=LoggerSettings(tensorboard_log_path="runs/tests"),
+        misc_settings=MiscellaneousSettings(compile_actor=True),
+    )
+    assert compile_model.actors[0].model._compiled_call_impl is not None
+    assert compile_model.critics[0].model._compiled_call_impl is None
+
+
 shutil.rmtree("runs/tests")
@@ -100,6 +100,118 @@ def test_add_batch_trajectories_and_sample(buffer_class):
     assert isinstance(trajectories_torch.observations, T.Tensor)
 
 
+@pytest.mark.parametrize("buffer_class", [ReplayBuffer, RolloutBuffer])
+@pytest.mark.parametrize("num_trajectories", [2, 5])
+def test_add_batch_trajectories_wraparound(buffer_class, num_trajectories):
+    observations = np.random.rand(num_trajectories, 4)
+    next_observations = np.random.rand(num_trajectories, 4)
+    actions = np.random.randint(0, 2, num_trajectories)
+    rewards = np.random.rand(num_trajectories)
+    dones = np.random.randint(0, 2, num_trajectories)
+
+    expected_buffer = buffer_class(env, buffer_size=3)
+    actual_buffer = buffer_class(env, buffer_size=3)
+    expected_buffer.pos = actual_buffer.pos = 2
+    for data in zip(observations, actions, rewards, next_observations, dones):
+        expected_buffer.add_trajectory(*data)
+    actual_buffer.add_batch_trajectories(
+        observations, actions, rewards, next_observations, dones
+    )
+
+    assert actual_buffer.pos == expected_buffer.pos
+    assert actual_buffer.full == expected_buffer.full
+    for field in ["observations", "actions", "rewards", "dones"]:
+        np.testing.assert_array_equal(
+            getattr(actual_buffer, field), getattr(expected_buffer, field)
+        )
+
+
+class PixelEnv(gym.Env):
+    observation_space = gym.spaces.Box(low=0, high=255, shape=(4, 4), dtype=np.uint8)
+    action_space = gym.spaces.Discrete(2)
+
+
+def test_rle_compression():
+    pixel_env = PixelEnv()
+    compressed_buffer = RolloutBuffer(pixel_env, buffer_size=3, compression="rle")
+    buffer = RolloutBuffer(pixel_env, buffer_size=3)
+    assert compressed_buffer.compressed
+
+    observations = np.zeros((4, 4, 4), dtype=np.uint8)
+    observations[:, :2] = 255
+    observations[1, 3, 3] = 7
+    # Observations without long runs wouldn't get smaller so are stored raw
+    observations[2] = np.arange(16).reshape(4, 4)
+    next_observations = observations[::-1].copy()
+    actions = np.array([0, 1, 0, 1])
+    rewards = np.ones(4)
+    dones = np.zeros(4)
+    for data in [compressed_buffer, buffer]:
+        data.add_trajectory(
+            observations[0], actions[0], rewards[0], next_observations[0], dones[0]
+        )
+        data.add_batch_trajectories(
+            observations[1:], actions[1:], rewards[1:], next_observations[1:], dones[1:]
+        )
+
+    assert compressed_buffer.observations[1].dtype.names == ("value", "length")
+    assert compressed_buffer.observations[1].dtype["length"] == np.uint8
+    assert compressed_buffer.observations[2].dtype == np.uint8
+
+    for method in ["all", "last"]:
+        args = (2,) if method == "last" else ()
+        expected = getattr(buffer, method)(*args, dtype="numpy")
+        actual = getattr(compressed_buffer, method)(*args, dtype="numpy")
+        np.testing.assert_array_equal(actual.observations, expected.observations)
+        np.testing.assert_array_equal(
+            actual.next_observations, expected.next_observations
+        )
+        assert actual.observations.dtype == np.uint8
+
+    compressed_buffer.reset()
+    assert compressed_buffer.all(dtype="numpy").observations.shape == (0, 4, 4)
+
+    with pytest.warns(UserWarning):
+        assert not RolloutBuffer(env, buffer_size=3, compression="rle").compressed
+    with pytest.raises(ValueError):
+        RolloutBuffer(env, buffer_size=3, compression="zip")
+    with pytest.raises(ValueError):
+        ReplayBuffer(pixel_env, buffer_size=3, compression="rle")
+
+
+@pytest.mark.parametrize("buffer_class", [ReplayBuffer, RolloutBuffer])
+def test_reset(buffer_class):
+    buffer = buffer_class(env, buffer_size=5)
+    obs = env.reset()
+    for _ in range(3):
+        action = env.action_space.sample()
+        next_obs, reward, done, _ = env.step(action)
+        buffer.add_trajectory(obs, action, reward, next_obs, done)
+        obs = next_obs
+    storage = [buffer.observations, buffer.actions, buffer.rewards, buffer.dones]
+
+    # The storage is cleared in place rather than reallocated
+    buffer.reset()
+    assert buffer.pos == 0
+    for expected, actual in zip(
+        storage, [buffer.observations, buffer.actions, buffer.rewards, buffer.dones]
+    ):
+        assert actual is expected
+        assert not actual.any()
+
+    # Only the written rows are cleared, unless the buffer has wrapped around
+    buffer.observations[-1] = 1
+    buffer.add_trajectory(obs, env.action_space.sample(), 1, obs, False)
+    buffer.reset()
+    assert buffer.observations[-1].all()
+    for _ in range(6):
+        buffer.add_trajectory(obs, env.action_space.sample(), 1, obs, False)
+    assert buffer.full
+    buffer.reset()
+    assert not buffer.observations.any()
+    assert not buffer.rewards.any()
+
+
 @pytest.mark.parametrize("buffer_class", [ReplayBuffer, RolloutBuffer])
 def test_last(buffer_class):
     num_steps = 10
@@ -1,10 +1,17 @@
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError
+
 import gym
 import numpy as np
 import pytest
 import torch as T
+import torch.distributed as dist
 from gym import spaces
 
 from pearll.common.utils import (
+    all_reduce_gradients,
+    broadcast_module_state,
     extend_shape,
     filter_dataclass_by_none,
     filter_rewards,
@@ -61,6 +68,13 @@ def test_one_input():
     T.equal(actual_output, one_torch)
 
 
+def test_staged_to_torch():
+    staging_buffer = T.empty(2, 2, dtype=T.float32)
+    actual_output = to_torch(np.ones(shape=(2, 2)), out=staging_buffer)
+    assert T.equal(actual_output, T.ones(2, 2))
+    assert actual_output.dtype == T.float32
+
+
 def test_extend_shape():
     shape = (1, 1, 1)
 
@@ -125,6 +139,9 @@ def test_filter_dataclass_by_none():
     actual_output = dataclass_example.filter_none()
     assert actual_output == expected_output
 
+    with pytest.raises(FrozenInstanceError):
+        dataclass_example.start_steps = 0
+
 
 def test_set_seed():
     env = gym.make("CartPole-v0")
@@ -188,3 +205,40 @@ def test_filter_rewards():
     actual_output = filter_rewards(rewards, dones)
     expected_output = np.array([1, 1, 1, 1, 1])
     np.testing.assert_array_equal(actual_output, expected_output)
+
+
+def test_all_reduce_gradients(monkeypatch):
+    parameter = T.nn.Parameter(T.ones(2, 2))
+    (parameter * 2).sum().backward()
+    expected_grad = parameter.grad.clone()
+
+    # Outside of distributed training the gradients are left alone
+    all_reduce_gradients([parameter])
+    assert T.equal(parameter.grad, expected_grad)
+
+    dist.init_process_group(
+        "gloo", init_method="tcp://127.0.0.1:29513", rank=0, world_size=1
+    )
+    try:
+        all_reduce_gradients([parameter])
+        broadcast_module_state(T.nn.Linear(2, 2))
+        assert T.equal(parameter.grad, expected_grad)
+
+        # The summed gradients are averaged over the processes
+        monkeypatch.setattr(dist, "get_world_size", lambda *args: 2)
+        all_reduce_gradients([parameter])
+    finally:
+        monkeypatch.undo()
+        dist.destroy_process_group()
+    assert T.equal(parameter.grad, expected_grad / 2)
+
+
+@pytest.mark.parametrize(
+    "module", ["pearll.updaters", "pearll.common.utils", "pearll.settings"]
+)
+def test_fresh_import(module):
+    # Run in a fresh interpreter so previously imported modules can't hide import cycles
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -195,6 +195,24 @@ def test_critic():
     assert T.equal(online_output, target_output)
 
 
+def test_quantized_critic_target():
+    input = T.rand(2, 5)
+    encoder = IdentityEncoder()
+    torso = MLP([5, 5])
+    head = ValueHead(input_shape=5)
+
+    critic = Critic(encoder, torso, head, create_target=True, quantize_target=True)
+    target_output = critic.forward_target(input)
+    T.testing.assert_close(target_output, critic(input), atol=0.05, rtol=0.05)
+    assert "_quantized_target" not in "".join(critic.state_dict().keys())
+
+    critic.set_state(np.random.rand(*critic.numpy().shape))
+    critic.assign_targets()
+    new_target_output = critic.forward_target(input)
+    assert not T.equal(target_output, new_target_output)
+    T.testing.assert_close(new_target_output, critic(input), atol=0.05, rtol=0.05)
+
+
 def test_actor():
     input = T.Tensor([1, 1, 1, 1, 1])
     encoder = IdentityEncoder()
@@ -420,7 +438,8 @@ def test_actor_critic_targets(actor_population_size, critic_population_size):
     critic_target_out = model.forward_target_critics(x_critic)
 
     assert T.equal(actor_out, actor_target_out)
-    assert T.equal(critic_out, critic_target_out)
+    # population target critics run as one vectorized pass so can differ in the last bits
+    assert T.allclose(critic_out, critic_target_out)
 
     actor_state = model.numpy_actors()
     critic_state = model.numpy_critics()
@@ -440,13 +459,47 @@ def test_actor_critic_targets(actor_population_size, critic_population_size):
     model.update_targets()
     model.assign_targets()
     assert not T.equal(model.forward_target_critics(x_critic), critic_target_out)
-    assert T.equal(
+    assert T.allclose(
         model.forward_target_critics(x_critic), model.forward_critics(x_critic)
     )
     assert not T.equal(model.forward_target_actors(x_actor), actor_target_out)
     assert T.equal(model.forward_target_actors(x_actor), model(x_actor))
 
 
+def test_actor_critic_member_target_update():
+    x_critic = T.Tensor([1, 1, 1, 1, 1]).repeat(2, 1)
+    actor = Actor(
+        IdentityEncoder(),
+        MLP([5, 5]),
+        DeterministicHead(input_shape=5, action_shape=1),
+    )
+    critic = Critic(
+        IdentityEncoder(), MLP([5, 5]), ValueHead(input_shape=5), create_target=True
+    )
+    model = ActorCritic(
+        actor, critic, population_settings=PopulationSettings(critic_population_size=2)
+    )
+
+    def loop_target_critics():
+        return T.stack(
+            [critic.forward_target(x) for critic, x in zip(model.critics, x_critic)]
+        )
+
+    assert T.allclose(model.forward_target_critics(x_critic), loop_target_critics())
+
+    # update a single member critic's targets without going through the ActorCritic
+    model.critics[0].set_state(np.random.rand(*model.critics[0].numpy().shape))
+    model.critics[0].assign_targets()
+    assert T.allclose(model.forward_target_critics(x_critic), loop_target_critics())
+
+    model.critics[1].set_state(np.random.rand(*model.critics[1].numpy().shape))
+    model.critics[1].update_targets()
+    assert T.allclose(model.forward_target_critics(x_critic), loop_target_critics())
+
+    model.critics[0].target.load_state_dict(model.critics[1].target.state_dict())
+    assert T.allclose(model.forward_target_critics(x_critic), loop_target_critics())
+
+
 def test_population_initialize():
     encoder_actor = IdentityEncoder()
     encoder_critic = IdentityEncoder()
@@ -471,6 +524,69 @@ def test_population_initialize():
     np.testing.assert_array_almost_equal(np.std(actor_state), 1, decimal=1.5)
 
 
+def test_population_array():
+    env = gym.make("CartPole-v0")
+    actor = Dummy(space=env.action_space)
+    critic = Dummy(space=env.action_space)
+    model = ActorCritic(
+        actor,
+        critic,
+        population_settings=PopulationSettings(
+            actor_population_size=4, actor_distribution="uniform"
+        ),
+    )
+    actor_state = model.numpy_actors()
+    assert actor_state.shape == (4, 1)
+    assert actor_state.flags["C_CONTIGUOUS"]
+    assert np.issubdtype(actor_state.dtype, np.integer)
+
+    # The returned population is a copy so the model isn't modified in place
+    actor_state += 1
+    assert not np.array_equal(model.numpy_actors(), actor_state)
+
+    # Float states upcast the population rather than being truncated
+    new_actor_state = np.full((4, 1), 0.5)
+    model.set_actors_state(new_actor_state)
+    np.testing.assert_array_equal(model.numpy_actors(), new_actor_state)
+    for actor, state in zip(model.actors, new_actor_state):
+        np.testing.assert_array_equal(actor.numpy(), state)
+
+    # Reduced precision storage is upcast when evaluated
+    model = ActorCritic(
+        Dummy(space=gym.spaces.Box(low=-1, high=1, shape=(2,))),
+        Dummy(space=gym.spaces.Box(low=-1, high=1, shape=(2,))),
+        population_settings=PopulationSettings(
+            actor_population_size=4, actor_distribution="uniform", dtype="float16"
+        ),
+    )
+    assert model.numpy_actors().dtype == np.float16
+    model.set_actors_state(np.random.rand(4, 2))
+    model.update_global()
+    assert model.numpy_actors().dtype == np.float16
+    assert model(env.observation_space.sample()).dtype == T.float32
+    assert model.actor(env.observation_space.sample()).dtype == T.float32
+
+    actor = Actor(IdentityEncoder(), MLP([5, 5]), DeterministicHead(5, action_shape=1))
+    critic = Critic(IdentityEncoder(), MLP([5, 5]), ValueHead(input_shape=5))
+    model = ActorCritic(
+        actor,
+        critic,
+        population_settings=PopulationSettings(
+            actor_population_size=3, actor_distribution="normal", dtype="float16"
+        ),
+    )
+    actor_state = model.numpy_actors()
+    assert actor_state.dtype == np.float16
+    assert model.numpy_critics().dtype == np.float16
+    model.set_actors_state(np.random.rand(*actor_state.shape))
+    actor_state = model.numpy_actors()
+    assert actor_state.dtype == np.float16
+    for actor, state in zip(model.actors, actor_state):
+        parameters = T.cat([p.flatten() for p in actor.model.state_dict().values()])
+        assert parameters.dtype == T.float32
+        np.testing.assert_array_equal(parameters.numpy(), state.astype(np.float32))
+
+
 @pytest.mark.parametrize("actor_population_size", [1, 2])
 def test_action_distribution(actor_population_size):
     input = T.Tensor([1, 1, 1, 1, 1]).repeat(actor_population_size, 1)
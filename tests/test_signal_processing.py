@@ -103,6 +103,17 @@ def test_soft_q_target():
 
     T.equal(actual_target, expected_target)
 
+    actual_target = soft_q_target(
+        np.ones(3, dtype=np.float32),
+        np.array([0, 0, 1], dtype=np.float32),
+        np.ones(3, dtype=np.float32),
+        np.full(3, -1, dtype=np.float32),
+        1,
+        1,
+    )
+    expected_target = np.array([3, 3, 1], dtype=np.float32)
+    np.testing.assert_array_equal(actual_target, expected_target)
+
 
 def test_naive_selection():
     population = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
@@ -143,6 +154,9 @@ def test_roulette_selection():
 
     np.testing.assert_array_equal(actual_population, expected_population)
 
+    with pytest.raises(ValueError):
+        roulette_selection(population, np.array([2, -1, 3]))
+
 
 def test_fit_gaussian():
     np.random.seed(9)
@@ -225,3 +239,23 @@ def test_discrete_uniform_mutation():
     expected_population = np.array([[2], [0], [1]])
     assert np.issubdtype(actual_population.dtype, np.integer)
     np.testing.assert_array_almost_equal(actual_population, expected_population)
+
+
+def test_operator_rng():
+    action_space = gym.spaces.Box(low=-1, high=1, shape=(3,))
+    population = np.zeros((4, 3), dtype=np.float32)
+    fitness_scores = np.array([1, 2, 3, 4])
+    global_state = np.random.get_state()[1].copy()
+
+    # A seeded generator gives reproducible results without touching the global random state
+    actual_populations = []
+    for _ in range(2):
+        rng = np.random.default_rng(0)
+        selected = roulette_selection(population, fitness_scores, rng=rng)
+        children = one_point_crossover(selected, rng=rng)
+        actual_populations.append(
+            gaussian_mutation(children, action_space, mutation_rate=1, rng=rng)
+        )
+    np.testing.assert_array_equal(actual_populations[0], actual_populations[1])
+    assert not np.all(actual_populations[0] == 0)
+    np.testing.assert_array_equal(np.random.get_state()[1], global_state)
@@ -1,10 +1,12 @@
 import copy
+from functools import partial
 from typing import Union
 
 import gym
 import numpy as np
 import pytest
 import torch as T
+import torch.distributed as dist
 
 from pearll.models import Actor, ActorCritic, Critic, Dummy
 from pearll.models.actor_critics import Model
@@ -29,7 +31,7 @@ from pearll.updaters.critics import (
     ValueRegression,
 )
 from pearll.updaters.environment import DeepRegression
-from pearll.updaters.evolution import GeneticUpdater, NoisyGradientAscent
+from pearll.updaters.evolution import GeneticUpdater, NoisyGradientAscent, PBTUpdater
 
 ############################### SET UP MODELS ###############################
 
@@ -234,10 +236,11 @@ def test_soft_policy_gradient(model: ActorCritic):
 ############################### TEST CRITIC UPDATERS ###############################
 
 
+@pytest.mark.parametrize("mixed_precision", [False, True])
 @pytest.mark.parametrize(
     "model", [critic, actor_critic, actor_critic_shared, marl, marl_shared]
 )
-def test_value_regression(model: Union[Critic, ActorCritic]):
+def test_value_regression(model: Union[Critic, ActorCritic], mixed_precision: bool):
     observation = T.rand(2)
     returns = T.rand(1)
     if model != critic:
@@ -248,7 +251,7 @@ def test_value_regression(model: Union[Critic, ActorCritic]):
     else:
         out_before = model(observation)
 
-    updater = ValueRegression(max_grad=0.5)
+    updater = ValueRegression(max_grad=0.5, mixed_precision=mixed_precision)
 
     updater(model, observation, returns)
 
@@ -329,6 +332,33 @@ def test_continuous_q_regression(model: Union[Critic, ActorCritic]):
         assert same_distribution(actor_before, actor_after)
 
 
+def test_critic_optimizer_cached():
+    observation = T.rand(2)
+    returns = T.rand(1)
+    updater = ValueRegression()
+
+    updater(critic, observation, returns)
+    optimizer = updater._optimizer
+    updater(critic, observation, returns, learning_rate=0.01)
+
+    assert updater._optimizer is optimizer
+    assert optimizer.param_groups[0]["lr"] == 0.01
+    assert all(state["step"] == 2 for state in optimizer.state.values())
+
+    updater(actor_critic, observation, returns)
+    assert updater._optimizer is not optimizer
+
+
+def test_critic_gradient_clipping():
+    model = copy.deepcopy(critic)
+    updater = ValueRegression(max_grad=1e-3)
+
+    updater(model, T.rand(2), T.rand(1) + 10)
+
+    grad_norm = T.norm(T.stack([p.grad.norm() for p in model.parameters()]))
+    assert grad_norm <= 1e-3 + 1e-6
+
+
 ############################### TEST EVOLUTION UPDATERS ###############################
 
 
@@ -373,6 +403,27 @@ env_discrete = gym.vector.SyncVectorEnv(
 )
 
 
+@pytest.mark.parametrize(
+    "updater", [PolicyGradient(), ValueRegression(), DeepRegression()]
+)
+def test_run_optimizer_all_reduce(updater, monkeypatch):
+    parameter = T.nn.Parameter(T.ones(2))
+    optimizer = T.optim.SGD([parameter], lr=0)
+    loss = (parameter * 2).sum()
+
+    dist.init_process_group(
+        "gloo", init_method="tcp://127.0.0.1:29514", rank=0, world_size=1
+    )
+    # Pretend there's a second process contributing zero gradients
+    monkeypatch.setattr(dist, "get_world_size", lambda *args: 2)
+    try:
+        updater.run_optimizer(optimizer, loss, [parameter])
+    finally:
+        monkeypatch.undo()
+        dist.destroy_process_group()
+    assert T.equal(parameter.grad, T.ones(2))
+
+
 def test_evolutionary_updater_continuous():
     actor_continuous = Dummy(
         space=env_continuous.single_action_space, state=np.array([10, 10])
@@ -534,6 +585,158 @@ def test_genetic_updater_discrete():
     np.testing.assert_array_less(np.min(new_population, axis=0), np.array([5]))
 
 
+def test_genetic_updater_epochs():
+    actor_continuous = Dummy(
+        space=env_continuous.single_action_space, state=np.array([10, 10])
+    )
+    critic = Dummy(space=env_continuous.single_action_space)
+    model_continuous = ActorCritic(
+        actor=actor_continuous,
+        critic=critic,
+        population_settings=PopulationSettings(
+            actor_population_size=POPULATION_SIZE, actor_distribution="normal"
+        ),
+    )
+    model_epochs = copy.deepcopy(model_continuous)
+    action = model_continuous(np.zeros(POPULATION_SIZE))
+    _, rewards, _, _ = env_continuous.step(action)
+    operators = dict(
+        selection_operator=selection_operators.roulette_selection,
+        crossover_operator=crossover_operators.one_point_crossover,
+        mutation_operator=mutation_operators.uniform_mutation,
+    )
+
+    # Running several epochs in one call matches running them one call at a time
+    np.random.seed(0)
+    updater = GeneticUpdater(model_continuous)
+    logs = [updater(rewards=rewards, **operators) for _ in range(3)]
+    np.random.seed(0)
+    updater = GeneticUpdater(model_epochs)
+    log = updater(rewards=rewards, num_epochs=3, **operators)
+
+    np.testing.assert_array_equal(
+        model_epochs.numpy_actors(), model_continuous.numpy_actors()
+    )
+    np.testing.assert_allclose(log.divergence, sum(l.divergence for l in logs))
+    np.testing.assert_allclose(log.entropy, np.mean([l.entropy for l in logs]))
+
+
+def test_genetic_updater_no_elite():
+    actor_continuous = Dummy(
+        space=env_continuous.single_action_space, state=np.array([10, 10])
+    )
+    critic = Dummy(space=env_continuous.single_action_space)
+    model_continuous = ActorCritic(
+        actor=actor_continuous,
+        critic=critic,
+        population_settings=PopulationSettings(
+            actor_population_size=5, actor_distribution="normal"
+        ),
+    )
+    updater = GeneticUpdater(model_continuous)
+    old_population = model_continuous.numpy_actors()
+
+    # 10% of 5 individuals rounds down to no elite, so every individual is mutated
+    updater(
+        rewards=np.arange(5),
+        mutation_operator=partial(mutation_operators.uniform_mutation, mutation_rate=1),
+        elitism=0.1,
+    )
+    new_population = model_continuous.numpy_actors()
+    assert not np.isclose(old_population, new_population).all(axis=1).any()
+
+    # Equal rewards skip selection
+    old_population = new_population
+    updater(
+        rewards=np.zeros(5),
+        selection_operator=selection_operators.roulette_selection,
+        elitism=0,
+    )
+    np.testing.assert_array_equal(model_continuous.numpy_actors(), old_population)
+
+
+def test_pbt_updater():
+    actor_continuous = Dummy(
+        space=env_continuous.single_action_space, state=np.array([10, 10])
+    )
+    critic = Dummy(space=env_continuous.single_action_space)
+    model_continuous = ActorCritic(
+        actor=actor_continuous,
+        critic=critic,
+        population_settings=PopulationSettings(
+            actor_population_size=POPULATION_SIZE, actor_distribution="normal"
+        ),
+    )
+    updater = PBTUpdater(model_continuous)
+    old_population = model_continuous.numpy_actors()
+    action = model_continuous(np.zeros(POPULATION_SIZE))
+    _, rewards, _, _ = env_continuous.step(action)
+
+    log = updater(rewards=rewards)
+    new_population = model_continuous.numpy_actors()
+    ranking = np.argsort(rewards)
+    worst_indices, best_indices = ranking[:20], ranking[-20:]
+
+    assert log.divergence > 0
+    # Only the worst individuals are replaced
+    np.testing.assert_array_equal(
+        np.delete(new_population, worst_indices, axis=0),
+        np.delete(old_population, worst_indices, axis=0),
+    )
+    # By a perturbed copy of one of the best individuals
+    candidates = np.concatenate(
+        [old_population[best_indices] * 0.8, old_population[best_indices] * 1.2]
+    )
+    for individual in new_population[worst_indices]:
+        assert np.isclose(candidates, individual).all(axis=1).any()
+
+    # A seeded generator gives reproducible updates
+    populations = []
+    for _ in range(2):
+        model_continuous.set_actors_state(old_population)
+        updater(rewards=rewards, rng=np.random.default_rng(0))
+        populations.append(model_continuous.numpy_actors())
+    np.testing.assert_array_equal(populations[0], populations[1])
+
+    # Zero states can't be scaled so are shifted instead
+    model_continuous.set_actors_state(np.zeros_like(old_population))
+    updater(rewards=rewards, rng=np.random.default_rng(0))
+    np.testing.assert_allclose(
+        np.abs(model_continuous.numpy_actors()[worst_indices]), 0.2
+    )
+
+    # Discrete states step to a neighbouring integer
+    actor_discrete = Dummy(space=env_discrete.single_action_space, state=np.array([5]))
+    model_discrete = ActorCritic(
+        actor=actor_discrete,
+        critic=Dummy(space=env_discrete.single_action_space),
+        population_settings=PopulationSettings(
+            actor_population_size=POPULATION_SIZE, actor_distribution="normal"
+        ),
+    )
+    updater = PBTUpdater(model_discrete)
+    old_population = model_discrete.numpy_actors()
+    _, rewards, _, _ = env_discrete.step(model_discrete(np.zeros(POPULATION_SIZE)))
+    updater(rewards=rewards, rng=np.random.default_rng(0))
+    new_population = model_discrete.numpy_actors()
+    # Rewards tie in the discrete environment, so compare against every tied best individual
+    best_population = old_population[rewards >= np.sort(rewards)[-20]]
+
+    assert np.issubdtype(new_population.dtype, np.integer)
+    for new_individual, old_individual in zip(new_population, old_population):
+        assert (new_individual == old_individual).all() or (
+            (np.abs(best_population - new_individual) <= 1).all(axis=1).any()
+        )
+    # Small values are still explored rather than rounded back
+    model_discrete.set_actors_state(np.zeros_like(old_population))
+    updater(rewards=rewards, rng=np.random.default_rng(0))
+    assert model_discrete.numpy_actors().any()
+
+    # The truncated best and worst individuals can't overlap
+    with pytest.raises(ValueError):
+        PBTUpdater(model_continuous, truncation_ratio=0.6)
+
+
 ############################### TEST ENVIRONMENT UPDATERS ###############################
 
 